@@ -1,15 +1,32 @@
+import asyncio
+import logging
 import os
 import re
-from groq import Groq
-from typing import Optional, Tuple
+import string
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from groq import AsyncGroq
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# History helpers
+# ============================================================
+
+def _tail(history, n: int) -> list:
+    """Last n entries of the history (works for lists and deques)"""
+    return list(islice(history, max(0, len(history) - n), None))
+
 
 # ============================================================
 # Lazy Groq client initialization
 # ============================================================
 
-_groq_client: Optional[Groq] = None
+_groq_client: Optional[AsyncGroq] = None
 
-def _get_groq_client() -> Optional[Groq]:
+def _get_groq_client() -> Optional[AsyncGroq]:
     """Initialize Groq client lazily with API key validation"""
     global _groq_client
 
@@ -17,18 +34,18 @@ def _get_groq_client() -> Optional[Groq]:
         return _groq_client
 
     api_key = os.getenv("GROQ_API_KEY")
-    print(f"🔑 GROQ API KEY: {'✅ FOUND' if api_key else '❌ MISSING'}")
+    logger.info("🔑 GROQ API KEY: %s", "✅ FOUND" if api_key else "❌ MISSING")
 
     if not api_key:
-        print("⚠️ Set GROQ_API_KEY environment variable for LLM responses")
+        logger.warning("⚠️ Set GROQ_API_KEY environment variable for LLM responses")
         return None
 
     try:
-        _groq_client = Groq(api_key=api_key)
-        print("✅ Groq client initialized successfully")
+        _groq_client = AsyncGroq(api_key=api_key)
+        logger.info("✅ Groq client initialized successfully")
         return _groq_client
     except Exception as e:
-        print(f"❌ Groq client init failed: {type(e).__name__}: {str(e)}")
+        logger.error("❌ Groq client init failed: %s: %s", type(e).__name__, e)
         return None
 
 
@@ -36,37 +53,47 @@ def _get_groq_client() -> Optional[Groq]:
 # Language detection system
 # ============================================================
 
-def _detect_language(text: str) -> str:
+# Common Hinglish markers
+HINGLISH_WORDS = [
+    'bhai', 'yaar', 'kya', 'hai', 'haan', 'nahi', 'theek', 'accha',
+    'arre', 'beta', 'ji', 'aapka', 'mera', 'karo', 'bolo', 'suno',
+    'abhi', 'phir', 'kab', 'kahan', 'kyun', 'kaise', 'aap', 'aapne',
+    'mujhe', 'mere', 'tumhara', 'humara', 'wala', 'wali', 'kar', 'ho'
+]
+
+# Compiled once at import - reused on every request
+_HINDI_RE = re.compile(r'[\u0900-\u097F]')
+_LATIN_HINDI_RE = re.compile(r'[a-zA-Z\u0900-\u097F]')
+_WORD_RE = re.compile(r'\b\w+\b')
+_HINGLISH_SET = frozenset(HINGLISH_WORDS)
+
+
+@lru_cache(maxsize=4096)
+def _detect_language(text_lower: str) -> str:
     """
     Detect if message is in English, Hinglish, or Hindi
+    Expects already-lowercased text (see _analyze_message)
     Returns: 'english', 'hinglish', or 'hindi'
     """
-    text_lower = text.lower()
-    
     # Hindi script detection (Devanagari Unicode range)
-    hindi_chars = len(re.findall(r'[\u0900-\u097F]', text))
-    total_chars = len(re.findall(r'[a-zA-Z\u0900-\u097F]', text))
-    
-    if total_chars == 0:
-        return 'english'
-    
-    hindi_ratio = hindi_chars / total_chars if total_chars > 0 else 0
+    # No Devanagari at all → ratio is 0, no need to count characters.
+    # isascii() is a constant-time flag check, so pure ASCII messages
+    # (most English/Hinglish traffic) skip the regex entirely.
+    if text_lower.isascii() or _HINDI_RE.search(text_lower) is None:
+        hindi_ratio = 0
+    else:
+        hindi_chars = sum(1 for _ in _HINDI_RE.finditer(text_lower))
+        total_chars = sum(1 for _ in _LATIN_HINDI_RE.finditer(text_lower))
+        hindi_ratio = hindi_chars / total_chars
     
     # Pure Hindi (>80% Devanagari)
     if hindi_ratio > 0.8:
         return 'hindi'
     
-    # Common Hinglish markers
-    hinglish_words = [
-        'bhai', 'yaar', 'kya', 'hai', 'haan', 'nahi', 'theek', 'accha',
-        'arre', 'beta', 'ji', 'aapka', 'mera', 'karo', 'bolo', 'suno',
-        'abhi', 'phir', 'kab', 'kahan', 'kyun', 'kaise', 'aap', 'aapne',
-        'mujhe', 'mere', 'tumhara', 'humara', 'wala', 'wali', 'kar', 'ho'
-    ]
-    
     # Check for Hinglish patterns
-    words = re.findall(r'\b\w+\b', text_lower)
-    hinglish_count = sum(1 for word in words if word in hinglish_words)
+    hinglish_count = sum(
+        1 for word in _WORD_RE.finditer(text_lower) if word.group() in _HINGLISH_SET
+    )
     
     # Hinglish if contains Hindi words or mixed script
     if hinglish_count > 0 or (hindi_ratio > 0.1 and hindi_ratio < 0.8):
@@ -79,58 +106,71 @@ def _detect_language(text: str) -> str:
 # Enhanced intent detection
 # ============================================================
 
-def _detect_intent(msg: str) -> str:
-    """
-    Detect scammer's intent from message keywords
-    Enhanced with more patterns and multilingual support
-    """
-    msg_lower = msg.lower()
-    
+# Checked in priority order - first category with a hit wins.
+# Built once at import so detection never rebuilds keyword lists.
+INTENT_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
     # Credential theft patterns
-    if any(word in msg_lower for word in [
+    ("credential_trap", (
         'otp', 'pin', 'password', 'cvv', 'code', 'verify', 'verification',
         'passcode', 'security code', 'आओटीपी', 'पासवर्ड', 'कोड'
-    ]):
-        return "credential_trap"
-    
+    )),
     # Money/payment patterns
-    if any(word in msg_lower for word in [
+    ("money_trap", (
         'upi', 'payment', 'refund', 'amount', 'rs', 'money', 'rupees',
         'paytm', 'phonepe', 'gpay', 'transfer', 'account', 'रुपये', 'पैसे'
-    ]):
-        return "money_trap"
-    
+    )),
     # Authority impersonation
-    if any(word in msg_lower for word in [
+    ("authority_trap", (
         'bank', 'police', 'officer', 'department', 'rbi', 'government',
         'official', 'cybercrime', 'पुलिस', 'बैंक', 'सरकार'
-    ]):
-        return "authority_trap"
-    
+    )),
     # Device access attempts
-    if any(word in msg_lower for word in [
+    ("device_trap", (
         'install', 'download', 'anydesk', 'teamviewer', 'remote',
         'app', 'link', 'click', 'डाउनलोड', 'इंस्टॉल'
-    ]):
-        return "device_trap"
-    
+    )),
     # Panic/urgency tactics
-    if any(word in msg_lower for word in [
+    ("panic_trap", (
         'urgent', 'block', 'suspend', 'arrest', 'immediately', 'now',
         'hurry', 'quick', 'emergency', 'जल्दी', 'तुरंत'
-    ]):
-        return "panic_trap"
-    
+    )),
     # Greeting/introduction
-    if any(word in msg_lower for word in [
+    ("greeting", (
         'hello', 'hi', 'good morning', 'good afternoon', 'good evening',
         'this is', 'i am calling from', 'नमस्ते', 'हेलो'
-    ]):
-        return "greeting"
+    )),
+)
+
+
+@lru_cache(maxsize=4096)
+def _detect_intent(msg_lower: str) -> str:
+    """
+    Detect scammer's intent from message keywords
+    Enhanced with more patterns and multilingual support
+    Expects already-lowercased text (see _analyze_message)
+    """
+    for intent, keywords in INTENT_KEYWORDS:
+        for word in keywords:
+            if word in msg_lower:
+                return intent
     
     return "unknown"
 
 
+# ============================================================
+# Combined message analysis
+# ============================================================
+
+def _analyze_message(text: str) -> Tuple[str, str]:
+    """
+    Detect language and intent in one go
+    Lowercases the message once and shares it between both detectors
+    Returns: (language, intent)
+    """
+    text_lower = text.lower()
+    return _detect_language(text_lower), _detect_intent(text_lower)
+
+
 # ============================================================
 # Strategy selector - smooth transition
 # ============================================================
@@ -269,70 +309,190 @@ MANUAL_RESPONSES = {
     }
 }
 
+# Flattened (intent, language) → replies, with the english fallback
+# resolved at import so the hot path is a single dict lookup
+_LANGUAGES = ("english", "hinglish", "hindi")
+
+_MANUAL_FLAT: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    (intent, language): tuple(by_language.get(language, by_language["english"]))
+    for intent, by_language in MANUAL_RESPONSES.items()
+    for language in _LANGUAGES
+}
+
+
+# Canned replies for trivial turns (greetings, "ok", empty messages)
+DIRECT_REPLIES = {
+    "english": [
+        "Hello? Who is this?",
+        "Yes?",
+        "Okay... what is this about?",
+        "Hmm, tell me."
+    ],
+    "hinglish": [
+        "Hello? Kaun bol raha hai?",
+        "Haan ji?",
+        "Achha... kis baare mein hai?",
+        "Hmm, boliye."
+    ],
+    "hindi": [
+        "हैलो? कौन बोल रहा है?",
+        "हाँ जी?",
+        "अच्छा... किस बारे में है?",
+        "हम्म, बताइए।"
+    ]
+}
+
+
+def direct_reply(history, agent_count: int) -> str:
+    """
+    Canned reply for a trivial turn, in the conversation's language
+    Rotates on agent_count, which keeps growing after the bounded
+    history stops changing length
+    """
+    language = _detect_language(
+        " ".join(m.message for m in history if m.role == "scammer").lower()
+    )
+    replies = DIRECT_REPLIES[language]
+    return replies[agent_count % len(replies)]
+
 
 # ============================================================
 # Groq LLM engine with language-aware prompts
 # ============================================================
 
-def _groq_generate_reply(history: list, language: str) -> str:
+# Language-specific system prompts (built once at import)
+SYSTEM_PROMPTS = {
+    "english": (
+        "You are a 60-year-old Indian person who gets confused by phone calls. "
+        "Reply ONLY in English with a confused, hesitant tone. "
+        "Use phrases like 'excuse me', 'sorry', 'I don't understand', 'what do you mean'. "
+        "Keep replies SHORT (under 15 words), casual, and slightly confused. "
+        "Ask innocent questions showing you don't fully understand. "
+        "NEVER mention: scam, fraud, police, AI, bot, suspicious, fake. "
+        "Sound like a real confused elderly person."
+    ),
+    "hinglish": (
+        "You are a 60-year-old Indian person who gets confused by phone calls. "
+        "Reply in HINGLISH (Hindi-English mix) with a confused tone. "
+        "Use phrases like 'arre beta', 'haan ji', 'accha', 'samajh nahi aaya', 'kya matlab'. "
+        "Keep replies SHORT (under 15 words), casual, and slightly confused. "
+        "Mix Hindi words naturally with English. Ask innocent questions. "
+        "NEVER mention: scam, fraud, police, AI, bot, suspicious, fake, dhoka. "
+        "Sound like a real confused Indian elder speaking casually."
+    ),
+    "hindi": (
+        "आप एक 60 वर्षीय भारतीय व्यक्ति हैं जो फोन कॉल से भ्रमित हो जाते हैं। "
+        "केवल हिंदी में भ्रमित स्वर में जवाब दें। "
+        "'अरे बेटा', 'हां जी', 'अच्छा', 'समझ नहीं आया', 'क्या मतलब' जैसे शब्द इस्तेमाल करें। "
+        "जवाब छोटे रखें (15 शब्दों से कम), सहज और थोड़े भ्रमित। "
+        "मासूम सवाल पूछें। कभी न कहें: घोटाला, धोखा, पुलिस, AI, बॉट, संदिग्ध। "
+        "असली भ्रमित बुजुर्ग की तरह बोलें।"
+    )
+}
+
+# Used when no Groq client is configured
+_UNAVAILABLE_FALLBACKS = {
+    "english": "Sorry, can you repeat that?",
+    "hinglish": "Thoda repeat kariye please",
+    "hindi": "क्षमा करें, फिर से बोलिए?"
+}
+
+# Used when a Groq call fails or returns an unusable reply
+_ERROR_FALLBACKS = {
+    "english": "Sorry, I didn't catch that. Can you repeat?",
+    "hinglish": "Thoda network issue hai, dobara boliye",
+    "hindi": "नेटवर्क खराब है, फिर से बोलिए"
+}
+
+_DEFAULT_FALLBACK = "Can you say that again?"
+
+# AI self-identification phrases - matched against the lowercased reply,
+# so every entry must itself be lowercase
+FORBIDDEN_PHRASES: Tuple[str, ...] = (
+    "i am an ai", "i'm an ai", "i am a bot", "i'm a bot",
+    "as an ai", "as a language model", "मैं एक ai हूं"
+)
+
+# Fallbacks are never cached - the next turn should retry Groq
+_FALLBACK_REPLIES = frozenset(
+    [*_UNAVAILABLE_FALLBACKS.values(), *_ERROR_FALLBACKS.values(), _DEFAULT_FALLBACK]
+)
+
+def _mentions_ai(text: str) -> bool:
+    """True if the reply gives away that it was written by an AI"""
+    text_lower = text.lower()
+    for phrase in FORBIDDEN_PHRASES:
+        if phrase in text_lower:
+            return True
+    return False
+
+
+# Replies are streamed and cut off as soon as they read as complete
+MAX_REPLY_WORDS = 15  # matches the "under 15 words" persona instruction
+# A terminator only ends a sentence once whitespace and the next token
+# have streamed in, so "Rs." / "2." are not taken as final mid-stream
+# (group 1 is that next token's first character)
+_SENTENCE_END_RE = re.compile(r'[.?!।](?=\s+(\S))')
+
+# Words after which a period does not end the sentence
+_ABBREVIATIONS = frozenset({
+    "rs", "mr", "mrs", "ms", "dr", "sr", "jr", "st", "no", "vs",
+    "etc", "ltd", "pvt", "govt", "dept", "approx", "inr",
+})
+
+
+def _ends_sentence(text: str, match: "re.Match") -> bool:
+    if text[match.start()] != ".":
+        return True
+    if match.group(1).isdigit():
+        return False  # "Rs. 500", "No. 4"
+    words = text[:match.start()].split()
+    return not words or words[-1].lower().lstrip("(\"'") not in _ABBREVIATIONS
+
+
+def _complete_reply(text: str) -> Optional[Tuple[str, bool]]:
+    """
+    Check whether a partially streamed reply is already usable
+    Returns (reply, truncated) once a sentence ends after 3+ words
+    or the word cap is passed, otherwise None to keep streaming.
+    truncated is True when the word cap cut the reply mid-sentence
+    """
+    words = text.split()
+    if len(words) > MAX_REPLY_WORDS:
+        return " ".join(words[:MAX_REPLY_WORDS]), True
+
+    for match in _SENTENCE_END_RE.finditer(text):
+        if len(text[:match.end()].split()) >= 3 and _ends_sentence(text, match):
+            return text[:match.end()], False
+
+    return None
+
+
+async def _groq_generate_reply(history: list, language: str) -> Tuple[str, bool]:
     """
     Generate realistic reply using Groq LLM
     Adapts persona and language based on detected language
+    Returns (reply, cacheable); truncated replies are not cacheable
     """
     client = _get_groq_client()
     if client is None:
-        print("⚠️ GROQ CLIENT UNAVAILABLE - Using fallback")
-        fallbacks = {
-            "english": "Sorry, can you repeat that?",
-            "hinglish": "Thoda repeat kariye please",
-            "hindi": "क्षमा करें, फिर से बोलिए?"
-        }
-        return fallbacks.get(language, "Can you say that again?")
+        logger.warning("GROQ CLIENT UNAVAILABLE - Using fallback")
+        return _UNAVAILABLE_FALLBACKS.get(language, _DEFAULT_FALLBACK), False
 
     # Build conversation history (last 6 messages for context)
-    messages = []
-    for msg in history[-6:]:
-        role = "assistant" if msg.get("role") == "agent" else "user"
-        content = msg.get("message", "").strip()
-        if content:
-            messages.append({"role": role, "content": content})
-
-    # Language-specific system prompts
-    system_prompts = {
-        "english": (
-            "You are a 60-year-old Indian person who gets confused by phone calls. "
-            "Reply ONLY in English with a confused, hesitant tone. "
-            "Use phrases like 'excuse me', 'sorry', 'I don't understand', 'what do you mean'. "
-            "Keep replies SHORT (under 15 words), casual, and slightly confused. "
-            "Ask innocent questions showing you don't fully understand. "
-            "NEVER mention: scam, fraud, police, AI, bot, suspicious, fake. "
-            "Sound like a real confused elderly person."
-        ),
-        "hinglish": (
-            "You are a 60-year-old Indian person who gets confused by phone calls. "
-            "Reply in HINGLISH (Hindi-English mix) with a confused tone. "
-            "Use phrases like 'arre beta', 'haan ji', 'accha', 'samajh nahi aaya', 'kya matlab'. "
-            "Keep replies SHORT (under 15 words), casual, and slightly confused. "
-            "Mix Hindi words naturally with English. Ask innocent questions. "
-            "NEVER mention: scam, fraud, police, AI, bot, suspicious, fake, dhoka. "
-            "Sound like a real confused Indian elder speaking casually."
-        ),
-        "hindi": (
-            "आप एक 60 वर्षीय भारतीय व्यक्ति हैं जो फोन कॉल से भ्रमित हो जाते हैं। "
-            "केवल हिंदी में भ्रमित स्वर में जवाब दें। "
-            "'अरे बेटा', 'हां जी', 'अच्छा', 'समझ नहीं आया', 'क्या मतलब' जैसे शब्द इस्तेमाल करें। "
-            "जवाब छोटे रखें (15 शब्दों से कम), सहज और थोड़े भ्रमित। "
-            "मासूम सवाल पूछें। कभी न कहें: घोटाला, धोखा, पुलिस, AI, बॉट, संदिग्ध। "
-            "असली भ्रमित बुजुर्ग की तरह बोलें।"
-        )
-    }
+    # Messages are already stripped when stored (memory.append_message)
+    messages = [
+        {"role": "assistant" if msg.role == "agent" else "user", "content": msg.message}
+        for msg in _tail(history, 6)
+        if msg.message
+    ]
 
-    system_prompt = system_prompts.get(language, system_prompts["english"])
+    system_prompt = SYSTEM_PROMPTS.get(language, SYSTEM_PROMPTS["english"])
 
     try:
-        print(f"🤖 CALLING GROQ | Language: {language.upper()} | History: {len(messages)} messages")
+        logger.debug("CALLING GROQ | Language: %s | History: %d messages", language, len(messages))
         
-        completion = client.chat.completions.create(
+        stream = await client.chat.completions.create(
             model="llama-3.1-8b-instant",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -340,110 +500,195 @@ def _groq_generate_reply(history: list, language: str) -> str:
             ],
             temperature=0.8,  # Higher for more natural variation
             max_tokens=60,    # Enough for complete thoughts
-            top_p=0.9
+            top_p=0.9,
+            stream=True       # Stop early instead of waiting for all tokens
         )
 
-        response_text = completion.choices[0].message.content.strip()
-        print(f"✅ GROQ RESPONSE: '{response_text}'")
+        buffer = ""
+        complete = None
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                buffer += chunk.choices[0].delta.content or ""
+                complete = _complete_reply(buffer)
+                if complete is not None:
+                    break
+        finally:
+            await stream.close()
+
+        # Stream ran out before a cut-off point: the whole buffer is the reply
+        response_text, truncated = complete if complete is not None else (buffer, False)
+        response_text = response_text.strip()
+        logger.debug("GROQ RESPONSE: '%s'", response_text)
 
         # Validate response
         if not response_text:
-            print("❌ Empty response from Groq")
-            return _get_fallback_response(language)
+            logger.warning("Empty response from Groq")
+            return _get_fallback_response(language), False
 
         # Block AI self-identification
-        forbidden_phrases = [
-            "i am an ai", "i'm an ai", "i am a bot", "i'm a bot",
-            "as an ai", "as a language model", "मैं एक AI हूं"
-        ]
-        if any(phrase in response_text.lower() for phrase in forbidden_phrases):
-            print("❌ Groq tried to self-identify as AI - using fallback")
-            return _get_fallback_response(language)
+        if _mentions_ai(response_text):
+            logger.warning("Groq tried to self-identify as AI - using fallback")
+            return _get_fallback_response(language), False
 
-        return response_text
+        return response_text, not truncated
 
     except Exception as e:
-        print(f"🔥 GROQ ERROR: {type(e).__name__}: {str(e)}")
-        return _get_fallback_response(language)
+        logger.error("GROQ ERROR: %s: %s", type(e).__name__, e)
+        return _get_fallback_response(language), False
 
 
 def _get_fallback_response(language: str) -> str:
     """Fallback responses when Groq fails"""
-    fallbacks = {
-        "english": "Sorry, I didn't catch that. Can you repeat?",
-        "hinglish": "Thoda network issue hai, dobara boliye",
-        "hindi": "नेटवर्क खराब है, फिर से बोलिए"
-    }
-    return fallbacks.get(language, "Can you say that again?")
+    return _ERROR_FALLBACKS.get(language, _DEFAULT_FALLBACK)
+
+
+# ============================================================
+# LLM reply cache
+# ============================================================
+
+# Scam scripts repeat heavily ("send OTP", "send OTP now"), so the same
+# language + intent + recent exchange usually wants the same reply
+REPLY_CACHE_SIZE = 2048
+
+_REPLY_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+# ASCII punctuation plus the Devanagari danda, each mapped to a space
+_CACHE_PUNCT_TABLE = str.maketrans({c: " " for c in string.punctuation + "।॥"})
+
+
+def _normalize_for_cache(message: str) -> str:
+    """Casefold, drop punctuation and collapse whitespace, so variants of
+    the same scripted line ("Send OTP now!!" vs "send otp now") share a
+    cache entry. Letters are kept whole: Devanagari vowel signs are not
+    \w, so rebuilding the key from \w runs would merge different words"""
+    return " ".join(message.casefold().translate(_CACHE_PUNCT_TABLE).split())
+
+
+def _reply_cache_key(history: list, language: str, intent: str) -> tuple:
+    """Cache key: language, intent and the last 3 normalized (role, message) pairs"""
+    recent = tuple(
+        (m.role, _normalize_for_cache(m.message))
+        for m in _tail(history, 3)
+    )
+    return (language, intent, recent)
+
+
+def _get_cached_reply(key: tuple) -> Optional[str]:
+    reply = _REPLY_CACHE.get(key)
+    if reply is not None:
+        _REPLY_CACHE.move_to_end(key)
+    return reply
+
+
+def _store_cached_reply(key: tuple, reply: str) -> None:
+    if reply in _FALLBACK_REPLIES:
+        return
+    _REPLY_CACHE[key] = reply
+    _REPLY_CACHE.move_to_end(key)
+    if len(_REPLY_CACHE) > REPLY_CACHE_SIZE:
+        _REPLY_CACHE.popitem(last=False)
+
+
+# Groq calls currently running, by reply cache key. Concurrent turns with
+# the same key (a scam script blasted at many numbers at once) await the
+# one call instead of each paying a round trip.
+_IN_FLIGHT: Dict[tuple, "asyncio.Task[Tuple[str, bool]]"] = {}
+
+
+async def _coalesced_groq_reply(key: tuple, history: list, language: str) -> str:
+    """Groq reply for `history`, a snapshot list the caller owns (never
+    the live deque); concurrent callers with the same key share one call"""
+    task = _IN_FLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_groq_generate_reply(history, language))
+        _IN_FLIGHT[key] = task
+        task.add_done_callback(lambda _: _IN_FLIGHT.pop(key, None))
+        # Whoever started the call fills the cache; shield so one
+        # cancelled request does not cancel the call for the others
+        reply, cacheable = await asyncio.shield(task)
+        if cacheable:
+            _store_cached_reply(key, reply)
+        return reply
+
+    logger.debug("Joining in-flight Groq call")
+    reply, _ = await asyncio.shield(task)
+    return reply
 
 
 # ============================================================
 # MAIN ENTRY POINT
 # ============================================================
 
-def generate_agent_reply(history: list) -> str:
+async def generate_agent_reply(history: list, agent_count: Optional[int] = None) -> str:
     """
     Main function to generate agent's reply based on conversation history
     
     Args:
-        history: List of message dicts with 'role' and 'message' keys
+        history: Sequence of memory.Turn entries (oldest first)
+        agent_count: Agent replies so far (counted from history if omitted)
         
     Returns:
         str: Agent's response message
     """
-    print("\n" + "="*60)
-    print("🎯 GENERATING AGENT REPLY")
-    print("="*60)
+    logger.debug("GENERATING AGENT REPLY")
     
     # Handle empty history
     if not history:
-        print("📭 Empty history - returning default greeting")
+        logger.debug("Empty history - returning default greeting")
         return "Hello?"
 
     # Find last scammer message
     last_scammer_msg = None
     for msg in reversed(history):
-        if msg.get("role") == "scammer":
-            last_scammer_msg = msg.get("message", "").strip()
+        if msg.role == "scammer":
+            last_scammer_msg = msg.message
             break
 
     if not last_scammer_msg:
-        print("❌ No scammer message found")
+        logger.debug("No scammer message found")
         return "Yes, I'm listening?"
 
-    print(f"📨 Last scammer message: '{last_scammer_msg}'")
+    logger.debug("Last scammer message: '%s'", last_scammer_msg)
 
-    # Detect language
-    language = _detect_language(last_scammer_msg)
-    print(f"🌐 Detected language: {language.upper()}")
+    # Detect language + intent (single lowercase pass)
+    language, intent = _analyze_message(last_scammer_msg)
+    logger.debug("Detected language: %s", language)
 
-    # Count agent messages
-    agent_count = sum(1 for m in history if m.get("role") == "agent")
-    print(f"📊 Agent message count: {agent_count}")
+    # Count agent messages (caller usually tracks this already)
+    if agent_count is None:
+        agent_count = sum(1 for m in history if m.role == "agent")
+    logger.debug("Agent message count: %d", agent_count)
 
-    # Detect intent
-    intent = _detect_intent(last_scammer_msg)
-    print(f"🎯 Detected intent: {intent}")
+    logger.debug("Detected intent: %s", intent)
 
     # Choose strategy
     strategy = _response_strategy(intent, agent_count)
-    print(f"🔀 Selected strategy: {strategy.upper()}")
+    logger.debug("Selected strategy: %s", strategy)
 
     # Generate response
     if strategy == "manual":
         # Get language-specific manual response
-        intent_responses = MANUAL_RESPONSES.get(intent, MANUAL_RESPONSES["unknown"])
-        lang_responses = intent_responses.get(language, intent_responses.get("english", ["I see"]))
+        lang_responses = _MANUAL_FLAT.get((intent, language)) or _MANUAL_FLAT[("unknown", language)]
         response = lang_responses[agent_count % len(lang_responses)]
-        print(f"📝 Manual response: '{response}'")
-        print("="*60 + "\n")
+        logger.debug("Manual response: '%s'", response)
         return response
     
     else:  # strategy == "llm"
-        print("🚀 Switching to LLM generation...")
-        response = _groq_generate_reply(history, language)
-        print(f"🎯 Final LLM response: '{response}'")
-        print("="*60 + "\n")
+        logger.debug("Switching to LLM generation...")
+        # Snapshot the prompt window before anything awaits: the live
+        # deque can take concurrent appends, and the cache key must
+        # describe exactly the turns the Groq call is prompted with
+        snapshot = _tail(history, 6)
+        cache_key = _reply_cache_key(snapshot, language, intent)
+        response = _get_cached_reply(cache_key)
+        if response is not None:
+            logger.debug("Reply cache hit")
+        else:
+            response = await _coalesced_groq_reply(cache_key, snapshot, language)
+        logger.debug("Final LLM response: '%s'", response)
         return response
 
 
@@ -460,16 +705,21 @@ if __name__ == "__main__":
         "आपका अकाउंट ब्लॉक हो गया है"
     ]
     for test in test_cases:
-        lang = _detect_language(test)
+        lang, _ = _analyze_message(test)
         print(f"  '{test}' → {lang}")
     
     # Test conversation flow
+    # Stand-in for memory.Turn: a relative import would fail when this
+    # file is run directly as a script
+    from collections import namedtuple
+    Turn = namedtuple("Turn", "role message")
+
     print("\n🧪 TESTING CONVERSATION FLOW:")
     test_history = [
-        {"role": "scammer", "message": "Hello sir, this is from SBI"},
-        {"role": "agent", "message": "Hello, who is this?"},
-        {"role": "scammer", "message": "We need your OTP to verify account"},
+        Turn("scammer", "Hello sir, this is from SBI"),
+        Turn("agent", "Hello, who is this?"),
+        Turn("scammer", "We need your OTP to verify account"),
     ]
     
-    response = generate_agent_reply(test_history)
+    response = asyncio.run(generate_agent_reply(test_history))
     print(f"\n✅ Generated response: '{response}'")
\ No newline at end of file
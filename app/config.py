@@ -2,3 +2,6 @@ import os
 
 API_KEY = os.getenv("API_KEY", "dev-secret-key")
 MAX_TURNS = 10
+
+# Verbose request logging (HONEYPOT_DEBUG=1); off in production
+DEBUG = os.getenv("HONEYPOT_DEBUG", "").lower() in ("1", "true", "yes")
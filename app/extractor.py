@@ -1,7 +1,10 @@
 import re
 
+_UPI_RE = re.compile(r"[a-zA-Z0-9.\-_]{2,}@[a-zA-Z]{2,}")
+_URL_RE = re.compile(r"https?://\S+")
+
 def extract_intel(text: str) -> dict:
     return {
-        "upi_id": re.findall(r"[a-zA-Z0-9.\-_]{2,}@[a-zA-Z]{2,}", text),
-        "urls": re.findall(r"https?://\S+", text)
+        "upi_id": _UPI_RE.findall(text),
+        "urls": _URL_RE.findall(text)
     }
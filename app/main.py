@@ -1,30 +1,64 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
+from typing import Optional, Tuple
+import asyncio
+import copy
 import logging
-import traceback
+import orjson
+from uuid import uuid4
 
 load_dotenv()
 
+from .config import DEBUG
 from .schemas import HoneypotRequest
-from .memory import get_history, append_message
-from .signals import hard_signal_scan, soft_signal_placeholder
+from .memory import get_history, append_message, get_agent_count
+from .signals import extract_signals, hard_signal_scan, soft_signal_placeholder
 from .policy import policy_gate
-from .agent import generate_agent_reply
+from .agent import direct_reply, generate_agent_reply, _get_groq_client as _get_agent_client
 from .extractor import extract_intel
-from .validator import extract_authority_claim, validate_authority_claim
+from .validator import (
+    extract_authority_claim, validate_authority_claim,
+    _get_groq_client as _get_validator_client
+)
 
 # ============================================================
 # LOGGING SETUP
 # ============================================================
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if DEBUG else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Agentic Honeypot API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the lazily-created pieces at startup, not on the first request"""
+    # Patterns and lookup tables are already built at import; the Groq
+    # clients are created on first use
+    _get_agent_client()
+    _get_validator_client()
+    # Bypasses the per-message cache so no warmup entry is stored
+    extract_signals("Sir, your SBI account is blocked, share OTP urgently")
+    yield
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson, which serializes the nested
+    response dicts in C. Defined here rather than using FastAPI's
+    deprecated ORJSONResponse"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+app = FastAPI(
+    title="Agentic Honeypot API",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -36,37 +70,115 @@ app.add_middleware(
 # ============================================================
 # REQUEST LOGGING MIDDLEWARE
 # ============================================================
-@app.middleware("http")
+MAX_LOGGED_BODY_BYTES = 512
+
 async def log_requests(request: Request, call_next):
-    """Log all incoming requests for debugging"""
+    """Log all incoming requests for debugging (only with HONEYPOT_DEBUG set)"""
+    if request.method == "GET":
+        return await call_next(request)
+
     try:
         body = await request.body()
-        logger.info("="*60)
-        logger.info(f"📥 INCOMING: {request.method} {request.url.path}")
-        logger.info(f"Headers: {dict(request.headers)}")
-        logger.info(f"Body: {body.decode('utf-8', errors='ignore')}")
-        logger.info("="*60)
+        logger.debug("Incoming: %s %s", request.method, request.url.path)
+        logger.debug("Headers: %s", request.headers)
+        # Cap the slice so a large upload is not decoded in full
+        logger.debug("Body: %s", body[:MAX_LOGGED_BODY_BYTES].decode("utf-8", errors="ignore"))
         
         response = await call_next(request)
         
-        logger.info(f"📤 RESPONSE: Status {response.status_code}")
+        logger.debug("Response: status %s", response.status_code)
         return response
         
-    except Exception as e:
-        logger.error(f"🔥 MIDDLEWARE ERROR: {type(e).__name__}: {str(e)}")
-        logger.error(traceback.format_exc())
-        return JSONResponse(
+    except Exception:
+        error_id = uuid4().hex
+        logger.exception("Middleware error [%s]", error_id)
+        return FastJSONResponse(
             status_code=500,
-            content={"error": "Middleware error", "detail": str(e)}
+            content={"error": "Middleware error", "error_id": error_id}
         )
 
+
+# Every middleware adds a coroutine hop per request, so only register
+# this one when someone is actually debugging; uvicorn's access log
+# covers request lines otherwise
+if DEBUG:
+    app.middleware("http")(log_requests)
+
+# ============================================================
+# REQUEST PARSING
+# ============================================================
+
+async def _read_json_body(request: Request) -> dict:
+    """Parse the JSON body; anything unparseable or non-object → {}"""
+    try:
+        body = await request.json()
+    except Exception as e:
+        logger.warning("JSON parse failed: %s, using empty dict", e)
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def _as_str(value, default: str) -> str:
+    """Client-supplied id / mode as a str; ints are stringified so 5 and
+    "5" name the same conversation, anything else falls back to default"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return default
+
+
+def _parse_request(body: dict) -> HoneypotRequest:
+    """
+    Build a HoneypotRequest from a raw body without re-running pydantic
+    validation. Accepts both the GUVI shape (sessionId, message.text)
+    and the plain shape (conversation_id, message).
+    Every field is coerced to the type HoneypotRequest declares here,
+    since model_construct does not check untrusted input itself.
+    """
+    message = body.get("message", "")
+    if isinstance(message, dict):
+        message = message.get("text", "")
+    if not isinstance(message, str):
+        message = ""
+
+    turn = body.get("turn", 1)
+    if isinstance(turn, bool) or not isinstance(turn, (int, str)):
+        turn = 1
+
+    return HoneypotRequest.model_construct(
+        conversation_id=_as_str(
+            body.get("sessionId") or body.get("conversation_id"), "default"
+        ),
+        turn=turn,
+        message=message,
+        execution_mode=_as_str(body.get("execution_mode"), "live")
+    )
+def _error_body(e: Exception, error_id: str) -> dict:
+    """
+    Minimal safe response for a failed request. Only the error type and
+    a correlation id go over the wire; the traceback stays in the logs.
+    """
+    return {
+        "scam_detected": False,
+        "risk_score": "ERROR",
+        "decision_confidence": "none",
+        "agent_reply": None,
+        "extracted_intelligence": {},
+        "engagement_metrics": {"turn": 1, "history_length": 0},
+        "explanation": {
+            "error_type": type(e).__name__,
+            "error_id": error_id
+        }
+    }
+
 # ============================================================
 # ENDPOINTS
 # ============================================================
 
 @app.get("/")
 def root():
-    logger.info("✅ Health check endpoint hit")
+    logger.debug("Health check endpoint hit")
     return {
         "status": "ok",
         "service": "agentic-honeypot-api",
@@ -77,93 +189,48 @@ def root():
 @app.post("/")
 async def root_post(request: Request):
     """Main endpoint - GUVI hits this"""
-    logger.info("🎯 ROOT POST endpoint called")
+    logger.debug("ROOT POST endpoint called")
     
     try:
         # Parse request body
-        try:
-            body = await request.json()
-            logger.info(f"✅ Parsed JSON: {body}")
-        except Exception as e:
-            logger.warning(f"⚠️ JSON parse failed: {e}, using empty dict")
-            body = {}
+        body = await _read_json_body(request)
+        logger.debug("Parsed JSON: %s", body)
         
-        # Create request object safely - CORRECTED VERSION
-        try:
-            raw_message = body.get("message", "")
-            
-            if isinstance(raw_message, dict):
-                raw_message = raw_message.get("text", "")
-                
-            req_data = HoneypotRequest(
-                conversation_id=body.get("sessionId") or body.get("conversation_id", "default"),
-                turn=body.get("turn", 1),
-                message=raw_message,
-                execution_mode=body.get("execution_mode", "live")
-            )
-            
-            logger.info(
-                f"✅ Created HoneypotRequest: "
-                f"conv_id={req_data.conversation_id}, "
-                f"turn={req_data.turn}, "
-                f"msg_type={type(raw_message)}"
-            )
-        except Exception as e:
-            logger.error(f"❌ Failed to create HoneypotRequest: {e}")
-            raise
+        req_data = _parse_request(body)
+        logger.debug(
+            "Created HoneypotRequest: conv_id=%s, turn=%s",
+            req_data.conversation_id, req_data.turn
+        )
         
         # Process request
-        result = honeypot_endpoint_logic(req_data)
-        logger.info(f"✅ Logic completed, returning response")
+        result = await honeypot_endpoint_logic(req_data)
+        logger.debug("Logic completed, returning response")
         
         return result
         
     except Exception as e:
-        logger.error(f"🔥 FATAL ERROR in root_post: {type(e).__name__}: {str(e)}")
-        logger.error(traceback.format_exc())
+        error_id = uuid4().hex
+        logger.exception("Fatal error in root_post [%s]", error_id)
         
         # Return safe fallback response
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=200,  # Return 200 to prevent GUVI rejection
-            content={
-                "scam_detected": False,
-                "risk_score": "ERROR",
-                "decision_confidence": "none",
-                "agent_reply": None,
-                "extracted_intelligence": {},
-                "engagement_metrics": {"turn": 1, "history_length": 0},
-                "explanation": {
-                    "error": str(e),
-                    "error_type": type(e).__name__
-                }
-            }
+            content=_error_body(e, error_id)
         )
 
 
 @app.post("/honeypot")
 async def honeypot_endpoint(request: Request):
-    """Secondary endpoint"""
-    logger.info("🎯 HONEYPOT endpoint called")
-    
-    try:
-        body = await request.json()
-    except:
-        body = {}
-    
-    req_data = HoneypotRequest(
-        conversation_id=body.get("conversation_id", "default"),
-        turn=body.get("turn", 1),
-        message=body.get("message", ""),
-        execution_mode=body.get("execution_mode", "live")
-    )
-    
-    return honeypot_endpoint_logic(req_data)
+    """Secondary endpoint - accepts the same body shapes as POST /"""
+    logger.debug("HONEYPOT endpoint called")
+    body = await _read_json_body(request)
+    return await honeypot_endpoint_logic(_parse_request(body))
 
 
 @app.post("/debug")
 async def debug_endpoint(request: Request):
     """Debugging endpoint - works because no processing"""
-    logger.info("🔍 DEBUG endpoint called")
+    logger.debug("DEBUG endpoint called")
     body = await request.body()
     headers = dict(request.headers)
     
@@ -176,88 +243,147 @@ async def debug_endpoint(request: Request):
     }
 
 
+# ============================================================
+# PIPELINE STAGES
+# ============================================================
+
+# Conservative decision used when the policy gate itself fails
+_POLICY_FALLBACK = {
+    "scam": False,
+    "risk": "UNKNOWN",
+    "confidence": "low",
+    "risk_band": "unknown",
+    "reasons": ["Policy error"]
+}
+
+
+def _run_stage(name: str, default, fn, *args):
+    """Run one pipeline stage; on failure log it and fall back to `default`"""
+    try:
+        return fn(*args)
+    except Exception as e:
+        logger.error("%s failed: %s", name, e)
+        return default
+
+
+def _scan_signals(message: str) -> Tuple[dict, dict]:
+    """Step 3: Signal extraction"""
+    hard = hard_signal_scan(message)
+    soft = soft_signal_placeholder(message)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Signals extracted - hard: %s, soft: %s", list(hard), list(soft))
+    return hard, soft
+
+
+def _validate_authority(message: str) -> dict:
+    """Step 4: Authority validation"""
+    claimed = extract_authority_claim(message)
+    return validate_authority_claim(claimed, message)
+
+
+def _decide(hard: dict, soft: dict, validation: dict) -> dict:
+    """Step 5: Policy decision"""
+    decision = policy_gate(hard=hard, soft=soft, validation=validation)
+    logger.debug("Policy decision: scam=%s, risk=%s", decision.get("scam"), decision.get("risk"))
+    return decision
+
+
+async def _generate_reply(req: HoneypotRequest, history) -> Optional[str]:
+    """Step 6: Agent reply (only if live mode)"""
+    if req.execution_mode != "live":
+        return None
+    try:
+        logger.debug("Generating agent reply")
+        agent_reply = await generate_agent_reply(
+            history,
+            agent_count=get_agent_count(req.conversation_id)
+        )
+        logger.debug("Agent reply generated: %.50r", agent_reply)
+        append_message(req.conversation_id, "agent", agent_reply)
+        return agent_reply
+    except Exception:
+        logger.exception("Agent reply failed")
+        return "I didn't understand. Can you repeat?"
+
+
+# ============================================================
+# DIRECT PATH (trivial turns)
+# ============================================================
+
+# Messages that carry no scam content on their own (compared after
+# stripping whitespace / trailing punctuation and lowercasing)
+TRIVIAL_MESSAGES = frozenset({
+    "", "hi", "hii", "hello", "hey", "ok", "okay", "k",
+    "yes", "no", "hmm", "thanks", "thank you"
+})
+
+
+def _is_trivial(message: str) -> bool:
+    return message.strip().lower().rstrip(".!?") in TRIVIAL_MESSAGES
+
+
+def _trivial_outcome():
+    """Stage outputs for a trivial message, computed once at import.
+    Shared template: hand out copies via copy.deepcopy, never the original"""
+    hard, soft = _scan_signals("")
+    validation = _validate_authority("")
+    return (hard, soft), validation, extract_intel(""), _decide(hard, soft, validation)
+
+
+_TRIVIAL_OUTCOME = _trivial_outcome()
+
+
+def _direct_reply(req: HoneypotRequest, history) -> Optional[str]:
+    """Canned agent reply for a trivial turn (only if live mode)"""
+    if req.execution_mode != "live":
+        return None
+    reply = direct_reply(history, get_agent_count(req.conversation_id))
+    append_message(req.conversation_id, "agent", reply)
+    return reply
+
+
 # ============================================================
 # CORE LOGIC WITH ERROR HANDLING
 # ============================================================
 
-def honeypot_endpoint_logic(req: HoneypotRequest):
+async def honeypot_endpoint_logic(req: HoneypotRequest):
     """Core processing logic with comprehensive error handling"""
     
     try:
-        logger.info(f"🔧 Processing message: '{req.message[:50]}...'")
+        logger.info(
+            "Processing conversation=%s turn=%s message=%.50r",
+            req.conversation_id, req.turn, req.message
+        )
         
-        # Step 1: Get history
+        # Steps 1-2: Append scammer message (returns the updated history)
         try:
-            history = get_history(req.conversation_id)
-            logger.info(f"✅ Retrieved history: {len(history)} messages")
+            history = append_message(req.conversation_id, "scammer", req.message)
+            logger.debug("Appended scammer message, history length: %d", len(history))
         except Exception as e:
-            logger.error(f"❌ get_history failed: {e}")
-            history = []
-        
-        # Step 2: Append scammer message
-        try:
-            append_message(req.conversation_id, "scammer", req.message)
+            logger.error("append_message failed: %s", e)
             history = get_history(req.conversation_id)
-            logger.info(f"✅ Appended scammer message, new history length: {len(history)}")
-        except Exception as e:
-            logger.error(f"❌ append_message failed: {e}")
-        
-        # Step 3: Signal extraction
-        try:
-            hard = hard_signal_scan(req.message)
-            soft = soft_signal_placeholder(req.message)
-            logger.info(f"✅ Signals extracted - hard: {list(hard.keys())}, soft: {list(soft.keys())}")
-        except Exception as e:
-            logger.error(f"❌ Signal extraction failed: {e}")
-            hard = {}
-            soft = {}
-        
-        # Step 4: Authority validation
-        try:
-            claimed = extract_authority_claim(req.message)
-            validation = validate_authority_claim(claimed, req.message)
-            logger.info(f"✅ Authority validation complete")
-        except Exception as e:
-            logger.error(f"❌ Validation failed: {e}")
-            claimed = {}
-            validation = {}
-        
-        # Step 5: Policy decision
-        try:
-            decision = policy_gate(hard=hard, soft=soft, validation=validation)
-            logger.info(f"✅ Policy decision: scam={decision.get('scam')}, risk={decision.get('risk')}")
-        except Exception as e:
-            logger.error(f"❌ Policy gate failed: {e}")
-            logger.error(traceback.format_exc())
-            decision = {
-                "scam": False,
-                "risk": "UNKNOWN",
-                "confidence": "low",
-                "risk_band": "unknown",
-                "reasons": [f"Policy error: {str(e)}"]
-            }
-        
-        # Step 6: Agent reply (only if live mode)
-        agent_reply = None
-        if req.execution_mode == "live":
-            try:
-                logger.info(f"🤖 Generating agent reply...")
-                history = get_history(req.conversation_id)
-                agent_reply = generate_agent_reply(history)
-                logger.info(f"✅ Agent reply generated: '{agent_reply[:50]}...'")
-                append_message(req.conversation_id, "agent", agent_reply)
-            except Exception as e:
-                logger.error(f"❌ Agent reply failed: {e}")
-                logger.error(traceback.format_exc())
-                agent_reply = "I didn't understand. Can you repeat?"
         
-        # Step 7: Intelligence extraction
-        try:
-            intel = extract_intel(req.message)
-            logger.info(f"✅ Intel extracted: {list(intel.keys()) if isinstance(intel, dict) else 'not a dict'}")
-        except Exception as e:
-            logger.error(f"❌ Intel extraction failed: {e}")
-            intel = {}
+        if _is_trivial(req.message):
+            # Direct path: empty / pleasantry-only turns have a fixed
+            # outcome, so skip the scans, validator and LLM entirely.
+            # Copied so no response shares mutable state with another
+            logger.debug("direct_hit")
+            (hard, soft), validation, intel, decision = copy.deepcopy(_TRIVIAL_OUTCOME)
+            agent_reply = _direct_reply(req, history)
+        else:
+            # Steps 3, 4, 6 and 7 only depend on the message / history,
+            # so run them concurrently: CPU and blocking stages in worker
+            # threads, the agent reply awaiting Groq on the event loop
+            (hard, soft), validation, agent_reply, intel = await asyncio.gather(
+                asyncio.to_thread(_run_stage, "Signal extraction", ({}, {}), _scan_signals, req.message),
+                asyncio.to_thread(_run_stage, "Validation", {}, _validate_authority, req.message),
+                _generate_reply(req, history),
+                asyncio.to_thread(_run_stage, "Intel extraction", {}, extract_intel, req.message),
+            )
+
+            # Step 5: Policy decision (needs signals + validation). A few
+            # microseconds of CPU: run inline, a thread hop costs more
+            decision = _run_stage("Policy gate", _POLICY_FALLBACK, _decide, hard, soft, validation)
         
         # Step 8: Build response
         response = {
@@ -279,24 +405,12 @@ def honeypot_endpoint_logic(req: HoneypotRequest):
             }
         }
         
-        logger.info(f"✅ Response built successfully")
+        logger.debug("Response built successfully")
         return response
         
     except Exception as e:
-        logger.error(f"🔥 CRITICAL ERROR in honeypot_endpoint_logic: {type(e).__name__}: {str(e)}")
-        logger.error(traceback.format_exc())
+        error_id = uuid4().hex
+        logger.exception("Critical error in honeypot_endpoint_logic [%s]", error_id)
         
         # Return minimal safe response
-        return {
-            "scam_detected": False,
-            "risk_score": "ERROR",
-            "decision_confidence": "none",
-            "agent_reply": None,
-            "extracted_intelligence": {},
-            "engagement_metrics": {"turn": 1, "history_length": 0},
-            "explanation": {
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "traceback": traceback.format_exc()
-            }
-        }
\ No newline at end of file
+        return _error_body(e, error_id)
\ No newline at end of file
@@ -2,30 +2,82 @@
 # In-memory conversation store (Hackathon / Demo safe)
 # -------------------------------------------------------------------
 
-from typing import Dict, List
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Tuple
 
 # Structure:
 # CONVERSATIONS = {
-#   conversation_id: [
-#       {
-#           "role": "scammer" | "agent",
-#           "message": str,
-#           "signals": dict   # snapshot of signals at that turn
-#       },
-#       ...
-#   ]
+#   conversation_id: deque([Turn, ...], maxlen=MAX_HISTORY)
 # }
 
-CONVERSATIONS: Dict[str, List[dict]] = {}
+
+@dataclass(slots=True)
+class Turn:
+    role: str                 # "scammer" | "agent"
+    message: str
+    signals: dict = field(default_factory=dict)  # snapshot of signals at that turn
+
 
 MAX_HISTORY = 6  # keep last N turns only (prevents memory bloat)
 
+# Bounded ring buffers - appending past MAX_HISTORY drops the oldest
+# entry in O(1) instead of re-slicing the list
+CONVERSATIONS: Dict[str, Deque[Turn]] = {}
+
+# Running count of agent replies per conversation.
+# Kept outside the trimmed history so callers get it in O(1).
+AGENT_COUNTS: Dict[str, int] = {}
+
+# Idle conversations are dropped after this many seconds so the store
+# does not grow without bound in a long-running process.
+CONVERSATION_TTL_SECONDS = 1800
+SWEEP_INTERVAL_SECONDS = 60
+
+# conversation_id -> monotonic time of last append
+LAST_SEEN: Dict[str, float] = {}
+_next_sweep = 0.0
+
+# conversation_id -> number of appends so far. Bumped on every append,
+# so it changes even once the deque is full and len() stays constant.
+VERSIONS: Dict[str, int] = {}
+
+# conversation_id -> (version, detect_escalation result)
+_ESCALATION_CACHE: Dict[str, Tuple[int, dict]] = {}
+
+# -------------------------------------------------------------------
+# Evict idle conversations (cheap, at most once per sweep interval)
+# -------------------------------------------------------------------
+
+def _evict_idle(now: float) -> None:
+    global _next_sweep
+    if now < _next_sweep:
+        return
+    _next_sweep = now + SWEEP_INTERVAL_SECONDS
+
+    cutoff = now - CONVERSATION_TTL_SECONDS
+    stale = [cid for cid, seen in LAST_SEEN.items() if seen < cutoff]
+    for cid in stale:
+        del LAST_SEEN[cid]
+        CONVERSATIONS.pop(cid, None)
+        AGENT_COUNTS.pop(cid, None)
+        VERSIONS.pop(cid, None)
+        _ESCALATION_CACHE.pop(cid, None)
+
 # -------------------------------------------------------------------
 # Get conversation history
 # -------------------------------------------------------------------
 
-def get_history(conversation_id: str) -> List[dict]:
-    return CONVERSATIONS.get(conversation_id, [])
+def get_history(conversation_id: str) -> Deque[Turn]:
+    return CONVERSATIONS.get(conversation_id) or deque(maxlen=MAX_HISTORY)
+
+# -------------------------------------------------------------------
+# Get number of agent replies so far
+# -------------------------------------------------------------------
+
+def get_agent_count(conversation_id: str) -> int:
+    return AGENT_COUNTS.get(conversation_id, 0)
 
 # -------------------------------------------------------------------
 # Append message with optional signal snapshot
@@ -36,18 +88,27 @@ def append_message(
     role: str,
     message: str,
     signals: dict = None
-):
-    entry = {
-        "role": role,
-        "message": message,
-        "signals": signals or {}
-    }
+) -> Deque[Turn]:
+    """
+    Append a message and return the (bounded) conversation history.
+    """
+    # Message is stripped once here, not on every read
+    entry = Turn(role, message.strip(), signals or {})
 
-    CONVERSATIONS.setdefault(conversation_id, []).append(entry)
+    history = CONVERSATIONS.get(conversation_id)
+    if history is None:
+        history = CONVERSATIONS[conversation_id] = deque(maxlen=MAX_HISTORY)
+    history.append(entry)
+    VERSIONS[conversation_id] = VERSIONS.get(conversation_id, 0) + 1
 
-    # Trim history to last N turns
-    if len(CONVERSATIONS[conversation_id]) > MAX_HISTORY:
-        CONVERSATIONS[conversation_id] = CONVERSATIONS[conversation_id][-MAX_HISTORY:]
+    if role == "agent":
+        AGENT_COUNTS[conversation_id] = AGENT_COUNTS.get(conversation_id, 0) + 1
+
+    now = time.monotonic()
+    LAST_SEEN[conversation_id] = now
+    _evict_idle(now)
+
+    return history
 
 # -------------------------------------------------------------------
 # Escalation Detection Logic
@@ -58,49 +119,63 @@ def detect_escalation(conversation_id: str) -> dict:
     Detects escalation based on signal progression across turns.
 
     Returns structured escalation signal (policy-friendly).
+    Cached per conversation until the next append.
     """
+    version = VERSIONS.get(conversation_id, 0)
+    cached = _ESCALATION_CACHE.get(conversation_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    result = _escalation_from_history(CONVERSATIONS.get(conversation_id, ()))
+    if version:
+        _ESCALATION_CACHE[conversation_id] = (version, result)
+    return result
+
+
+def _no_escalation() -> dict:
+    return {
+        "escalation": False,
+        "reason": "No sustained escalation pattern detected"
+    }
 
-    history = CONVERSATIONS.get(conversation_id, [])
+
+def _escalation_from_history(history) -> dict:
     if len(history) < 2:
         return {
             "escalation": False,
             "reason": "Insufficient conversation history"
         }
 
+    # Both conditions must hold, so bail out as soon as one cannot:
+    # - sustained urgency needs at least 3 scored turns
+    # - an irreversible action on the very first turn is not "late"
+    if len(history) < 3 or history[0].signals.get("irreversible_actions"):
+        return _no_escalation()
+
     urgency_scores = []
-    irreversible_turns = []
+    first_irreversible = None
 
     for idx, entry in enumerate(history):
-        signals = entry.get("signals", {})
+        signals = entry.signals
 
         urgency = signals.get("urgency_score")
         if isinstance(urgency, (int, float)):
             urgency_scores.append(urgency)
 
-        actions = signals.get("irreversible_actions", [])
-        if actions:
-            irreversible_turns.append(idx)
-
-    # ---- Condition 1: sustained urgency increase ----
-    urgency_escalating = False
-    if len(urgency_scores) >= 3:
-        urgency_escalating = urgency_scores[-1] > urgency_scores[-2] > urgency_scores[0]
+        if first_irreversible is None and signals.get("irreversible_actions"):
+            first_irreversible = idx
 
     # ---- Condition 2: irreversible introduced AFTER start ----
-    irreversible_late = (
-        len(irreversible_turns) > 0 and
-        irreversible_turns[0] > 0
-    )
+    if first_irreversible is None or len(urgency_scores) < 3:
+        return _no_escalation()
 
-    if urgency_escalating and irreversible_late:
+    # ---- Condition 1: sustained urgency increase ----
+    if urgency_scores[-1] > urgency_scores[-2] > urgency_scores[0]:
         return {
             "escalation": True,
             "reason": "Urgency increased across turns and irreversible action introduced later",
             "urgency_trend": urgency_scores,
-            "irreversible_first_seen_at_turn": irreversible_turns[0]
+            "irreversible_first_seen_at_turn": first_irreversible
         }
 
-    return {
-        "escalation": False,
-        "reason": "No sustained escalation pattern detected"
-    }
+    return _no_escalation()
@@ -16,25 +16,30 @@ DECISION AUTHORITY:
 This is the ONLY file that decides "scam" vs "legitimate"
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
-from enum import Enum
+from typing import Any, Callable, Iterable, List, Dict, Mapping, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from enum import Enum, IntEnum
+from types import MappingProxyType
+
+import orjson
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # RISK TAXONOMY
 # ═══════════════════════════════════════════════════════════════════════════
 
-class RiskBand(Enum):
+class RiskBand(IntEnum):
     """
     Risk bands with clear operational meaning.
     These are not arbitrary—they map to real-world harm potential.
+    Values are the severity ordinal (higher = more severe), so bands
+    compare directly; serialize with .name.
     """
-    CRITICAL = "CRITICAL"  # Immediate irreversible harm imminent
-    HIGH = "HIGH"          # Strong scam indicators, high confidence
-    MEDIUM = "MEDIUM"      # Suspicious patterns, needs more evidence
-    LOW = "LOW"            # Weak signals or legitimate w/ caution
-    BENIGN = "BENIGN"      # No scam indicators
+    CRITICAL = 4  # Immediate irreversible harm imminent
+    HIGH = 3      # Strong scam indicators, high confidence
+    MEDIUM = 2    # Suspicious patterns, needs more evidence
+    LOW = 1       # Weak signals or legitimate w/ caution
+    BENIGN = 0    # No scam indicators
 
 
 class EngagementStance(Enum):
@@ -45,44 +50,133 @@ class EngagementStance(Enum):
     ALLOW = "ALLOW"              # Normal conversation
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# REASON TEMPLATES
+# ═══════════════════════════════════════════════════════════════════════════
+# Reasons are stored as (template code, args) and only rendered to text when
+# a decision is serialized or explained. Tuple args render comma-joined.
+
+R_IRREVERSIBLE_HIGH = 1
+R_IRREVERSIBLE = 2
+R_LEGIT_VERIFICATION = 3
+R_CLASSIC_TRINITY = 4
+R_COMPOUND_PRESSURE = 5
+R_COMPOUND_WITH_AUTHORITY = 6
+R_THREAT = 7
+R_FEAR_PHRASES = 8
+R_IMPERSONATION_EXTRACTION = 9
+R_SUSPICIOUS_AUTHORITY = 10
+R_EXCESSIVE_FORMALITY = 11
+R_STRONG_URGENCY = 12
+R_INFO_EXTRACTION = 13
+R_WEAK_SIGNALS = 14
+R_BENIGN = 15
+R_RISK_FLOOR = 16
+R_ESCALATION = 17
+R_PERSISTENT_AUTHORITY = 18
+R_PERSISTENT_URGENCY = 19
+
+_TEMPLATES: Dict[int, str] = {
+    R_IRREVERSIBLE_HIGH: "🚨 HIGH-RISK IRREVERSIBLE ACTION REQUESTED: {0}",
+    R_IRREVERSIBLE: "⚠️  Irreversible action requested: {0}",
+    R_LEGIT_VERIFICATION: "✓ Legitimate verification request pattern",
+    R_CLASSIC_TRINITY: (
+        "🎯 CLASSIC SCAM PATTERN: Authority claim + urgency + "
+        "language mixing (Indian scam center signature)"
+    ),
+    R_COMPOUND_PRESSURE: "🔥 COMPOUND PRESSURE TACTICS: {0}",
+    R_COMPOUND_WITH_AUTHORITY: "Combined with authority claim — high risk",
+    R_THREAT: "⚖️ THREAT-BASED SCAM: Authority claim with fear tactics",
+    R_FEAR_PHRASES: "Fear phrases: {0}",
+    R_IMPERSONATION_EXTRACTION: (
+        "🎭 IMPERSONATION + DATA EXTRACTION: "
+        "Claiming to be from organization while requesting sensitive info"
+    ),
+    R_SUSPICIOUS_AUTHORITY: "⚠️  Suspicious authority claim: {0}",
+    R_EXCESSIVE_FORMALITY: "Excessive formality detected ({0} respect markers)",
+    R_STRONG_URGENCY: "⏰ {0} URGENCY detected: {1} urgency indicators",
+    R_INFO_EXTRACTION: "🔍 Information extraction attempt detected",
+    R_WEAK_SIGNALS: "ℹ️  Weak signals detected: {0}",
+    R_BENIGN: "✓ No scam indicators detected",
+    R_RISK_FLOOR: "⬆️ RISK FLOOR: Previous conversation reached {0} — risk cannot decrease",
+    R_ESCALATION: "📈 ESCALATION DETECTED: {0} → {1}",
+    R_PERSISTENT_AUTHORITY: "🔁 PERSISTENT AUTHORITY CLAIMS: {0} turns",
+    R_PERSISTENT_URGENCY: "🔁 PERSISTENT URGENCY: {0} turns",
+}
+
+
+class Reason(NamedTuple):
+    code: int
+    args: tuple = ()
+
+    def __str__(self) -> str:
+        return _TEMPLATES[self.code].format(
+            *(", ".join(a) if isinstance(a, tuple) else a for a in self.args)
+        )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # DECISION OUTPUT STRUCTURE
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
+# Shared read-only default for decisions that collect no evidence
+_NO_EVIDENCE: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class PolicyDecision:
     """
     Complete decision output.
     Must be auditable and explainable.
+    Immutable once built; derive adjusted copies with dataclasses.replace().
     """
     scam_detected: bool
     risk_band: RiskBand
     confidence: str  # "definitive", "high", "medium", "low"
-    reasons: List[str]
+    reasons: Tuple[Reason, ...]  # rendered to text by to_dict()
     
     engage: bool
     engagement_stance: EngagementStance
     
     # Operational guidance
-    recommended_actions: List[str] = field(default_factory=list)
-    evidence_collected: Dict[str, any] = field(default_factory=dict)
+    recommended_actions: Tuple[str, ...] = ()
+    # dataclasses reject unhashable defaults, so hand back the shared proxy
+    evidence_collected: Mapping[str, Any] = field(default_factory=lambda: _NO_EVIDENCE)
     
     # Escalation tracking
     turn_count: int = 0
     risk_trajectory: str = "stable"  # "escalating", "stable", "de-escalating"
     
+    # Tactics present in this turn (for cross-turn persistence checks)
+    had_authority: bool = False
+    had_urgency: bool = False
+    
+    # Rendered get_decision_explanation() text, filled on first use
+    _explanation: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Encoded to_dict() payload, filled on first to_json_bytes() call
+    _json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> dict:
         return {
             "scam_detected": self.scam_detected,
-            "risk_band": self.risk_band.value,
+            "risk_band": self.risk_band.name,
             "confidence": self.confidence,
-            "reasons": self.reasons,
+            "reasons": [str(r) for r in self.reasons],
             "engage": self.engage,
             "engagement_stance": self.engagement_stance.value,
-            "recommended_actions": self.recommended_actions,
+            "recommended_actions": list(self.recommended_actions),
             "turn_count": self.turn_count,
             "risk_trajectory": self.risk_trajectory
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        to_dict() encoded as JSON, built once per decision.
+        Safe to memoize because the decision is frozen.
+        """
+        if self._json is None:
+            object.__setattr__(self, "_json", orjson.dumps(self.to_dict()))
+        return self._json
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -111,26 +205,13 @@ class LegitimatePatterns:
         - They don't threaten arrest
         - They provide verifiable callback numbers
         """
-        irreversible = signals.irreversible
         psychological = signals.psychological
-        
-        # If requesting irreversible actions, not legitimate
-        if irreversible.has_any():
-            return False
-        
-        # If using fear tactics, not legitimate
-        if psychological.fear_tactics_present:
-            return False
-        
-        # If requesting credentials, not legitimate
-        if "credential_sharing" in irreversible.requested_actions:
-            return False
-        
-        # Verification request alone with low pressure = possibly legitimate
-        if psychological.verification_requested and not psychological.urgency_present:
-            return True
-        
-        return False
+        return _legit_verification(
+            psychological.verification_requested,
+            psychological.urgency_present,
+            signals.irreversible.has_any(),
+            psychological.fear_tactics_present
+        )
     
     @staticmethod
     def is_legitimate_authority(signals) -> bool:
@@ -142,22 +223,331 @@ class LegitimatePatterns:
         - Verification pathways offered
         """
         psychological = signals.psychological
-        linguistic = signals.linguistic
-        
-        # Authority claim with fear = not legitimate
-        if psychological.authority_claimed and psychological.fear_tactics_present:
-            return False
-        
-        # Authority + urgency + reward/fear combo = not legitimate
-        if psychological.authority_claimed and psychological.urgency_present:
-            if psychological.fear_tactics_present or psychological.reward_baiting:
-                return False
-        
-        # Authority claim with excessive respect markers = not legitimate
-        if psychological.authority_claimed and linguistic.excessive_respect:
-            return False
-        
-        return True
+        return _legit_authority(
+            psychological.authority_claimed,
+            psychological.urgency_present,
+            psychological.fear_tactics_present,
+            psychological.reward_baiting,
+            signals.linguistic.excessive_respect
+        )
+
+
+def _legit_verification(ver, urg, ir_any, fear) -> bool:
+    # Verification request alone with low pressure = possibly legitimate.
+    # Any irreversible action (credential sharing included) or fear
+    # tactic rules it out.
+    return bool(ver and not (urg or ir_any or fear))
+
+
+def _legit_authority(auth, urg, fear, reward, exc_resp) -> bool:
+    # Authority claim is not legitimate when combined with fear, with
+    # urgency + reward (urgency + fear is already covered by fear), or
+    # with excessive respect markers
+    return not (auth and (fear or (urg and reward) or exc_resp))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# DECISION TABLE
+# ═══════════════════════════════════════════════════════════════════════════
+# Each message is reduced once to a bitmask of condition flags. Rules are
+# checked in priority order (CRITICAL first); the first rule whose mask is
+# fully set wins. Reasons and evidence are only built for the winning rule.
+
+# ---- Condition bits ----
+C_IRREVERSIBLE_HIGH = 1 << 0      # high-risk irreversible action requested
+C_IRREVERSIBLE_ANY = 1 << 1       # any irreversible action requested
+C_LEGIT_VERIFICATION = 1 << 2     # matches the legitimate verification pattern
+C_AUTHORITY = 1 << 3
+C_URGENCY = 1 << 4
+C_FEAR = 1 << 5
+C_LANGUAGE_MIXING = 1 << 6
+C_MULTIPLE_TACTICS = 1 << 7       # contextual.multiple_urgency_layers
+C_INFO_EXTRACTION = 1 << 8
+C_IMPERSONATION = 1 << 9
+C_SUSPICIOUS_AUTHORITY = 1 << 10  # authority claim failing the legitimacy check
+C_STRONG_URGENCY = 1 << 11        # urgency intensity "high" or "medium"
+C_WEAK_SIGNAL = 1 << 12           # urgency / reward / mixing / formality
+
+
+def _condition_bits(signals) -> int:
+    irreversible = signals.irreversible
+    psychological = signals.psychological
+    linguistic = signals.linguistic
+    contextual = signals.contextual
+
+    # Read every attribute exactly once into a local
+    ir_hi = irreversible.has_high_risk()
+    ir_any = irreversible.has_any()
+    auth = psychological.authority_claimed
+    urg = psychological.urgency_present
+    fear = psychological.fear_tactics_present
+    reward = psychological.reward_baiting
+    ver = psychological.verification_requested
+    lang_mix = linguistic.language_mixing
+    exc_resp = linguistic.excessive_respect
+    imp = linguistic.impersonation_language
+    info_ext = contextual.information_extraction_attempt
+    mul = contextual.multiple_urgency_layers
+
+    # Most traffic carries no indicator at all: skip the packing below
+    if not (ir_hi or ir_any or auth or urg or fear or reward or ver or
+            lang_mix or exc_resp or imp or info_ext or mul):
+        return 0
+
+    bits = 0
+    if ir_hi:
+        bits |= C_IRREVERSIBLE_HIGH
+    if ir_any:
+        bits |= C_IRREVERSIBLE_ANY
+    if _legit_verification(ver, urg, ir_any, fear):
+        bits |= C_LEGIT_VERIFICATION
+    if auth:
+        bits |= C_AUTHORITY
+        if not _legit_authority(auth, urg, fear, reward, exc_resp):
+            bits |= C_SUSPICIOUS_AUTHORITY
+    if urg:
+        bits |= C_URGENCY
+        if psychological.urgency_intensity in ("high", "medium"):
+            bits |= C_STRONG_URGENCY
+    if fear:
+        bits |= C_FEAR
+    if lang_mix:
+        bits |= C_LANGUAGE_MIXING
+    if mul:
+        bits |= C_MULTIPLE_TACTICS
+    if info_ext:
+        bits |= C_INFO_EXTRACTION
+    if imp:
+        bits |= C_IMPERSONATION
+    if urg or reward or lang_mix or exc_resp:
+        bits |= C_WEAK_SIGNAL
+    return bits
+
+
+# ---- Reason / evidence builders (one per rule, cold path) ----
+
+def _explain_irreversible_high(signals):
+    irreversible = signals.irreversible
+    reasons = (Reason(R_IRREVERSIBLE_HIGH, (tuple(irreversible.requested_actions),)),)
+    evidence = {
+        "irreversible_actions": list(irreversible.requested_actions),
+        "explicit_phrases": irreversible.explicit_phrases
+    }
+    return reasons, evidence
+
+
+def _explain_irreversible(signals):
+    irreversible = signals.irreversible
+    reasons = (Reason(R_IRREVERSIBLE, (tuple(irreversible.requested_actions),)),)
+    return reasons, {"irreversible_actions": list(irreversible.requested_actions)}
+
+
+def _explain_legit_verification(signals):
+    return (Reason(R_LEGIT_VERIFICATION),), _NO_EVIDENCE
+
+
+def _explain_classic_trinity(signals):
+    psychological = signals.psychological
+    reasons = (Reason(R_CLASSIC_TRINITY),)
+    evidence = {
+        "pattern": "classic_indian_scam_trinity",
+        "authority_entities": psychological.authority_entities,
+        "urgency_intensity": psychological.urgency_intensity
+    }
+    return reasons, evidence
+
+
+def _explain_compound_pressure(signals):
+    combined = signals.contextual.combined_tactics
+    reasons = (Reason(R_COMPOUND_PRESSURE, (tuple(combined),)),)
+    return reasons, {"combined_tactics": combined}
+
+
+def _explain_compound_pressure_authority(signals):
+    reasons, evidence = _explain_compound_pressure(signals)
+    return (*reasons, Reason(R_COMPOUND_WITH_AUTHORITY)), evidence
+
+
+def _explain_threat(signals):
+    psychological = signals.psychological
+    reasons = (
+        Reason(R_THREAT),
+        Reason(R_FEAR_PHRASES, (tuple(psychological.fear_phrases[:3]),))
+    )
+    evidence = {
+        "authority_entities": psychological.authority_entities,
+        "fear_phrases": psychological.fear_phrases
+    }
+    return reasons, evidence
+
+
+def _explain_impersonation_extraction(signals):
+    reasons = (Reason(R_IMPERSONATION_EXTRACTION),)
+    evidence = {
+        "impersonation_phrases": signals.linguistic.impersonation_phrases,
+        "data_fields_requested": signals.contextual.data_fields_requested
+    }
+    return reasons, evidence
+
+
+def _explain_suspicious_authority(signals):
+    linguistic = signals.linguistic
+    reason = Reason(R_SUSPICIOUS_AUTHORITY, (tuple(signals.psychological.authority_entities[:2]),))
+    # With excessive respect = more suspicious
+    if linguistic.excessive_respect:
+        reasons = (reason, Reason(R_EXCESSIVE_FORMALITY, (linguistic.respect_marker_count,)))
+        return reasons, {"respect_marker_count": linguistic.respect_marker_count}
+    return (reason,), _NO_EVIDENCE
+
+
+def _explain_strong_urgency(signals):
+    psychological = signals.psychological
+    reasons = (
+        Reason(R_STRONG_URGENCY, (
+            psychological.urgency_intensity.upper(),
+            len(psychological.urgency_phrases)
+        )),
+    )
+    return reasons, {"urgency_phrases": psychological.urgency_phrases}
+
+
+def _explain_info_extraction(signals):
+    reasons = (Reason(R_INFO_EXTRACTION),)
+    return reasons, {"data_fields_requested": signals.contextual.data_fields_requested}
+
+
+def _explain_weak_signals(signals):
+    psychological = signals.psychological
+    linguistic = signals.linguistic
+    weak_signals = []
+    if psychological.urgency_present:
+        weak_signals.append("low urgency")
+    if psychological.reward_baiting:
+        weak_signals.append("reward baiting")
+    if linguistic.language_mixing:
+        weak_signals.append("language mixing")
+    if linguistic.excessive_respect:
+        weak_signals.append("excessive formality")
+    return (Reason(R_WEAK_SIGNALS, (tuple(weak_signals),)),), _NO_EVIDENCE
+
+
+_BENIGN_REASONS = (Reason(R_BENIGN),)
+
+
+def _explain_benign(signals):
+    return _BENIGN_REASONS, _NO_EVIDENCE
+
+
+class _Rule(NamedTuple):
+    mask: int                        # condition bits that must all be set
+    scam: bool
+    risk_band: RiskBand
+    confidence: str
+    stance: EngagementStance
+    actions: Tuple[str, ...]         # recommended actions
+    explain: Callable                # signals -> (reasons, evidence)
+
+
+_H = EngagementStance.ENGAGE_HONEYPOT
+_D = EngagementStance.ENGAGE_DEFENSIVE
+_A = EngagementStance.ALLOW
+
+# Priority order matters: first match wins
+_RULES: Tuple[_Rule, ...] = (
+    # TIER 1: CRITICAL — Irreversible harm imminent, regardless of anything else
+    _Rule(C_IRREVERSIBLE_HIGH, True, RiskBand.CRITICAL, "definitive", _H,
+          ("DO NOT comply with any requests",
+           "Gather scammer information",
+           "Log for law enforcement"),
+          _explain_irreversible_high),
+    # Any irreversible action (even lower risk) = HIGH
+    _Rule(C_IRREVERSIBLE_ANY, True, RiskBand.HIGH, "high", _H,
+          ("Do not comply",
+           "Continue engagement to gather intelligence"),
+          _explain_irreversible),
+
+    # WHITELIST: known legitimate verification pattern
+    _Rule(C_LEGIT_VERIFICATION, False, RiskBand.LOW, "medium", _A,
+          ("Monitor for escalation",),
+          _explain_legit_verification),
+
+    # TIER 2: HIGH — Dangerous pattern intersections
+    # Pattern 1: Classic Indian scam trinity (authority + urgency + mixing)
+    _Rule(C_AUTHORITY | C_URGENCY | C_LANGUAGE_MIXING, True, RiskBand.HIGH, "high", _H,
+          ("High-confidence scam detected",
+           "Continue engagement for intelligence gathering"),
+          _explain_classic_trinity),
+    # Pattern 2: Compound psychological pressure (HIGH with authority, else MEDIUM)
+    _Rule(C_MULTIPLE_TACTICS | C_AUTHORITY, True, RiskBand.HIGH, "high", _H,
+          (), _explain_compound_pressure_authority),
+    _Rule(C_MULTIPLE_TACTICS, True, RiskBand.MEDIUM, "medium", _D,
+          (), _explain_compound_pressure),
+    # Pattern 3: Authority + fear (threat-based scam)
+    _Rule(C_AUTHORITY | C_FEAR, True, RiskBand.HIGH, "high", _H,
+          (), _explain_threat),
+    # Pattern 4: Information extraction + impersonation
+    _Rule(C_INFO_EXTRACTION | C_IMPERSONATION, True, RiskBand.HIGH, "medium", _D,
+          (), _explain_impersonation_extraction),
+
+    # TIER 3: MEDIUM — Suspicious single strong signals
+    _Rule(C_SUSPICIOUS_AUTHORITY, True, RiskBand.MEDIUM, "medium", _D,
+          ("Request verification details",
+           "Monitor for escalation"),
+          _explain_suspicious_authority),
+    # High urgency alone — urgency alone is not scam
+    _Rule(C_STRONG_URGENCY, False, RiskBand.MEDIUM, "low", _D,
+          ("Monitor for additional signals",),
+          _explain_strong_urgency),
+    _Rule(C_INFO_EXTRACTION, False, RiskBand.MEDIUM, "low", _D,
+          (), _explain_info_extraction),
+
+    # TIER 4: LOW — Weak signals, keep monitoring
+    _Rule(C_WEAK_SIGNAL, False, RiskBand.LOW, "low", _A,
+          ("Continue monitoring",),
+          _explain_weak_signals),
+
+    # TIER 5: BENIGN — No indicators (always matches)
+    _Rule(0, False, RiskBand.BENIGN, "high", _A,
+          (), _explain_benign),
+)
+
+
+def _match_rule_id(bits: int) -> int:
+    """Index into _RULES of the first rule whose mask is fully set"""
+    for rule_id, rule in enumerate(_RULES):
+        if bits & rule.mask == rule.mask:
+            return rule_id
+    return len(_RULES) - 1
+
+
+# The bit space is small (13 flags -> 8192 masks), so every mask is
+# resolved against the table once at import and matching becomes a
+# single tuple index on the hot path
+_RULE_IDS: Tuple[int, ...] = tuple(
+    _match_rule_id(bits) for bits in range(C_WEAK_SIGNAL << 1)
+)
+
+
+def classify(signals) -> Tuple[bool, RiskBand, str, EngagementStance, int]:
+    """
+    Tier 1 of single-turn evaluation: the verdict only.
+    Returns (scam, risk_band, confidence, stance, rule_id) without
+    building reasons, evidence or a PolicyDecision. Callers that only
+    gate on the verdict can stop here; evaluate_single_turn adds the
+    explanation on top.
+    """
+    rule_id = _RULE_IDS[_condition_bits(signals)]
+    rule = _RULES[rule_id]
+    return rule.scam, rule.risk_band, rule.confidence, rule.stance, rule_id
+
+
+def score_batch(signals_batch: Iterable) -> List[RiskBand]:
+    """
+    Risk band for each signals object, without building reasons,
+    evidence or PolicyDecision objects (offline replay / regression runs).
+    Callers can run evaluate_message only on the rows they care about.
+    """
+    return [classify(s)[1] for s in signals_batch]
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -182,300 +572,32 @@ class ScamDetectionPolicy:
         Evaluate a single message in isolation.
         This is the foundation—multi-turn analysis builds on this.
         """
-        reasons = []
-        evidence = {}
-        
-        irreversible = signals.irreversible
-        psychological = signals.psychological
-        linguistic = signals.linguistic
-        contextual = signals.contextual
-        
-        # ─────────────────────────────────────────────────────────────────
-        # TIER 1: CRITICAL — Irreversible Harm Imminent
-        # ─────────────────────────────────────────────────────────────────
-        # If requesting actions that cause immediate, permanent harm,
-        # this is CRITICAL regardless of other factors.
-        
-        if irreversible.has_high_risk():
-            reasons.append(
-                f"🚨 HIGH-RISK IRREVERSIBLE ACTION REQUESTED: "
-                f"{', '.join(irreversible.requested_actions)}"
-            )
-            evidence["irreversible_actions"] = list(irreversible.requested_actions)
-            evidence["explicit_phrases"] = irreversible.explicit_phrases
-            
-            return PolicyDecision(
-                scam_detected=True,
-                risk_band=RiskBand.CRITICAL,
-                confidence="definitive",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ENGAGE_HONEYPOT,
-                recommended_actions=[
-                    "DO NOT comply with any requests",
-                    "Gather scammer information",
-                    "Log for law enforcement"
-                ],
-                evidence_collected=evidence
-            )
-        
-        # Any irreversible action (even lower risk) = HIGH
-        if irreversible.has_any():
-            reasons.append(
-                f"⚠️  Irreversible action requested: "
-                f"{', '.join(irreversible.requested_actions)}"
-            )
-            evidence["irreversible_actions"] = list(irreversible.requested_actions)
-            
-            return PolicyDecision(
-                scam_detected=True,
-                risk_band=RiskBand.HIGH,
-                confidence="high",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ENGAGE_HONEYPOT,
-                recommended_actions=[
-                    "Do not comply",
-                    "Continue engagement to gather intelligence"
-                ],
-                evidence_collected=evidence
-            )
-        
-        # ─────────────────────────────────────────────────────────────────
-        # WHITELIST CHECK: Legitimate Patterns
-        # ─────────────────────────────────────────────────────────────────
-        # Before evaluating combinations, check if this matches
-        # known legitimate patterns.
-        
-        if LegitimatePatterns.is_legitimate_verification(signals):
-            reasons.append("✓ Legitimate verification request pattern")
+        bits = _condition_bits(signals)
+        if not bits:
+            # Fast path for the common no-indicator case
             return PolicyDecision(
                 scam_detected=False,
-                risk_band=RiskBand.LOW,
-                confidence="medium",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ALLOW,
-                recommended_actions=["Monitor for escalation"]
-            )
-        
-        # ─────────────────────────────────────────────────────────────────
-        # TIER 2: HIGH — Dangerous Pattern Intersections
-        # ─────────────────────────────────────────────────────────────────
-        # Multiple strong signals converging = high confidence scam
-        
-        # Pattern 1: Classic Indian Scam Trinity
-        # Authority + Urgency + Language Mixing = signature pattern
-        if (psychological.authority_claimed and 
-            psychological.urgency_present and 
-            linguistic.language_mixing):
-            
-            reasons.append(
-                "🎯 CLASSIC SCAM PATTERN: Authority claim + urgency + "
-                "language mixing (Indian scam center signature)"
-            )
-            evidence["pattern"] = "classic_indian_scam_trinity"
-            evidence["authority_entities"] = psychological.authority_entities
-            evidence["urgency_intensity"] = psychological.urgency_intensity
-            
-            return PolicyDecision(
-                scam_detected=True,
-                risk_band=RiskBand.HIGH,
-                confidence="high",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ENGAGE_HONEYPOT,
-                recommended_actions=[
-                    "High-confidence scam detected",
-                    "Continue engagement for intelligence gathering"
-                ],
-                evidence_collected=evidence
-            )
-        
-        # Pattern 2: Compound Psychological Pressure
-        # Multiple pressure tactics = coordinated manipulation
-        if contextual.multiple_urgency_layers:
-            tactics = ", ".join(contextual.combined_tactics)
-            reasons.append(
-                f"🔥 COMPOUND PRESSURE TACTICS: {tactics}"
-            )
-            evidence["combined_tactics"] = contextual.combined_tactics
-            
-            # With authority claim = HIGH
-            if psychological.authority_claimed:
-                reasons.append("Combined with authority claim — high risk")
-                return PolicyDecision(
-                    scam_detected=True,
-                    risk_band=RiskBand.HIGH,
-                    confidence="high",
-                    reasons=reasons,
-                    engage=True,
-                    engagement_stance=EngagementStance.ENGAGE_HONEYPOT,
-                    evidence_collected=evidence
-                )
-            
-            # Without authority = MEDIUM
-            else:
-                return PolicyDecision(
-                    scam_detected=True,
-                    risk_band=RiskBand.MEDIUM,
-                    confidence="medium",
-                    reasons=reasons,
-                    engage=True,
-                    engagement_stance=EngagementStance.ENGAGE_DEFENSIVE,
-                    evidence_collected=evidence
-                )
-        
-        # Pattern 3: Authority + Fear (Threat-based scam)
-        if psychological.authority_claimed and psychological.fear_tactics_present:
-            reasons.append(
-                "⚖️ THREAT-BASED SCAM: Authority claim with fear tactics"
-            )
-            reasons.append(
-                f"Fear phrases: {', '.join(psychological.fear_phrases[:3])}"
-            )
-            evidence["authority_entities"] = psychological.authority_entities
-            evidence["fear_phrases"] = psychological.fear_phrases
-            
-            return PolicyDecision(
-                scam_detected=True,
-                risk_band=RiskBand.HIGH,
+                risk_band=RiskBand.BENIGN,
                 confidence="high",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ENGAGE_HONEYPOT,
-                evidence_collected=evidence
-            )
-        
-        # Pattern 4: Information Extraction + Impersonation
-        if (contextual.information_extraction_attempt and 
-            linguistic.impersonation_language):
-            
-            reasons.append(
-                "🎭 IMPERSONATION + DATA EXTRACTION: "
-                "Claiming to be from organization while requesting sensitive info"
-            )
-            evidence["impersonation_phrases"] = linguistic.impersonation_phrases
-            evidence["data_fields_requested"] = contextual.data_fields_requested
-            
-            return PolicyDecision(
-                scam_detected=True,
-                risk_band=RiskBand.HIGH,
-                confidence="medium",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ENGAGE_DEFENSIVE,
-                evidence_collected=evidence
-            )
-        
-        # ─────────────────────────────────────────────────────────────────
-        # TIER 3: MEDIUM — Suspicious Single Strong Signals
-        # ─────────────────────────────────────────────────────────────────
-        
-        # Authority claim without legitimacy markers
-        if psychological.authority_claimed:
-            if not LegitimatePatterns.is_legitimate_authority(signals):
-                reasons.append(
-                    f"⚠️  Suspicious authority claim: "
-                    f"{', '.join(psychological.authority_entities[:2])}"
-                )
-                
-                # With excessive respect = more suspicious
-                if linguistic.excessive_respect:
-                    reasons.append(
-                        f"Excessive formality detected "
-                        f"({linguistic.respect_marker_count} respect markers)"
-                    )
-                    evidence["respect_marker_count"] = linguistic.respect_marker_count
-                
-                return PolicyDecision(
-                    scam_detected=True,
-                    risk_band=RiskBand.MEDIUM,
-                    confidence="medium",
-                    reasons=reasons,
-                    engage=True,
-                    engagement_stance=EngagementStance.ENGAGE_DEFENSIVE,
-                    recommended_actions=[
-                        "Request verification details",
-                        "Monitor for escalation"
-                    ],
-                    evidence_collected=evidence
-                )
-        
-        # High urgency alone (without authority)
-        if psychological.urgency_present and psychological.urgency_intensity in ["high", "medium"]:
-            reasons.append(
-                f"⏰ {psychological.urgency_intensity.upper()} URGENCY detected: "
-                f"{len(psychological.urgency_phrases)} urgency indicators"
-            )
-            evidence["urgency_phrases"] = psychological.urgency_phrases
-            
-            return PolicyDecision(
-                scam_detected=False,  # Urgency alone is not scam
-                risk_band=RiskBand.MEDIUM,
-                confidence="low",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ENGAGE_DEFENSIVE,
-                recommended_actions=["Monitor for additional signals"],
-                evidence_collected=evidence
-            )
-        
-        # Information extraction attempt
-        if contextual.information_extraction_attempt:
-            reasons.append(
-                "🔍 Information extraction attempt detected"
-            )
-            evidence["data_fields_requested"] = contextual.data_fields_requested
-            
-            return PolicyDecision(
-                scam_detected=False,
-                risk_band=RiskBand.MEDIUM,
-                confidence="low",
-                reasons=reasons,
+                reasons=_BENIGN_REASONS,
                 engage=True,
-                engagement_stance=EngagementStance.ENGAGE_DEFENSIVE,
-                evidence_collected=evidence
+                engagement_stance=EngagementStance.ALLOW
             )
-        
-        # ─────────────────────────────────────────────────────────────────
-        # TIER 4: LOW — Weak Signals or Monitoring
-        # ─────────────────────────────────────────────────────────────────
-        
-        weak_signals = []
-        if psychological.urgency_present:
-            weak_signals.append("low urgency")
-        if psychological.reward_baiting:
-            weak_signals.append("reward baiting")
-        if linguistic.language_mixing:
-            weak_signals.append("language mixing")
-        if linguistic.excessive_respect:
-            weak_signals.append("excessive formality")
-        
-        if weak_signals:
-            reasons.append(f"ℹ️  Weak signals detected: {', '.join(weak_signals)}")
-            return PolicyDecision(
-                scam_detected=False,
-                risk_band=RiskBand.LOW,
-                confidence="low",
-                reasons=reasons,
-                engage=True,
-                engagement_stance=EngagementStance.ALLOW,
-                recommended_actions=["Continue monitoring"]
-            )
-        
-        # ─────────────────────────────────────────────────────────────────
-        # TIER 5: BENIGN — No Indicators
-        # ─────────────────────────────────────────────────────────────────
-        
-        reasons.append("✓ No scam indicators detected")
+
+        # Tier 2: explain only the rule tier 1 selected
+        rule = _RULES[_RULE_IDS[bits]]
+        reasons, evidence = rule.explain(signals)
         return PolicyDecision(
-            scam_detected=False,
-            risk_band=RiskBand.BENIGN,
-            confidence="high",
+            scam_detected=rule.scam,
+            risk_band=rule.risk_band,
+            confidence=rule.confidence,
             reasons=reasons,
             engage=True,
-            engagement_stance=EngagementStance.ALLOW
+            engagement_stance=rule.stance,
+            recommended_actions=rule.actions,
+            evidence_collected=evidence,
+            had_authority=bool(bits & C_AUTHORITY),
+            had_urgency=bool(bits & C_URGENCY)
         )
     
     @staticmethod
@@ -494,73 +616,73 @@ class ScamDetectionPolicy:
         
         # Get current turn decision
         current_decision = ScamDetectionPolicy.evaluate_single_turn(current_signals)
-        current_decision.turn_count = len(conversation_history) + 1
+        turn_count = len(conversation_history) + 1
         
         # First turn — return as-is
         if not conversation_history:
-            current_decision.risk_trajectory = "initial"
-            return current_decision
-        
-        # Find highest previous risk
-        previous_risks = [d.risk_band for d in conversation_history]
-        highest_previous = max(
-            previous_risks,
-            key=lambda r: list(RiskBand).index(r)
-        )
+            return replace(current_decision, turn_count=turn_count, risk_trajectory="initial")
+        
+        # Single pass over the history: highest previous risk, tactic
+        # persistence counts, and whether any turn was already a scam
+        highest_previous = None
+        authority_count = 0
+        urgency_count = 0
+        any_scam = False
+        for d in conversation_history:
+            if highest_previous is None or d.risk_band > highest_previous:
+                highest_previous = d.risk_band
+            if d.had_authority:
+                authority_count += 1
+            if d.had_urgency:
+                urgency_count += 1
+            if d.scam_detected:
+                any_scam = True
+        
+        # Decisions are frozen: collect the adjustments, build once at the end
+        risk_band = current_decision.risk_band
+        confidence = current_decision.confidence
+        reasons = current_decision.reasons
         
         # ESCALATION RULE: Risk cannot decrease
-        if list(RiskBand).index(current_decision.risk_band) < list(RiskBand).index(highest_previous):
-            current_decision.risk_band = highest_previous
-            current_decision.reasons.insert(
-                0,
-                f"⬆️ RISK FLOOR: Previous conversation reached {highest_previous.value} — "
-                "risk cannot decrease"
-            )
-            current_decision.risk_trajectory = "floor_applied"
+        if risk_band < highest_previous:
+            risk_band = highest_previous
+            reasons = (Reason(R_RISK_FLOOR, (highest_previous.name,)), *reasons)
         
         # Detect escalation
         previous_decision = conversation_history[-1]
-        if list(RiskBand).index(current_decision.risk_band) > list(RiskBand).index(previous_decision.risk_band):
-            current_decision.risk_trajectory = "escalating"
-            current_decision.reasons.insert(
-                0,
-                f"📈 ESCALATION DETECTED: {previous_decision.risk_band.value} → "
-                f"{current_decision.risk_band.value}"
-            )
+        if risk_band > previous_decision.risk_band:
+            risk_trajectory = "escalating"
+            reasons = (Reason(
+                R_ESCALATION,
+                (previous_decision.risk_band.name, risk_band.name)
+            ), *reasons)
         else:
-            current_decision.risk_trajectory = "stable"
+            risk_trajectory = "stable"
         
         # Persistence analysis: Same tactics repeated = more confidence
         if len(conversation_history) >= 2:
             # Check if authority claims persist
-            authority_count = sum(
-                1 for d in conversation_history 
-                if "authority" in str(d.evidence_collected)
-            )
             if authority_count >= 2 and current_signals.psychological.authority_claimed:
-                current_decision.reasons.append(
-                    f"🔁 PERSISTENT AUTHORITY CLAIMS: {authority_count + 1} turns"
-                )
+                reasons = (*reasons, Reason(R_PERSISTENT_AUTHORITY, (authority_count + 1,)))
                 # Upgrade confidence
-                if current_decision.confidence == "medium":
-                    current_decision.confidence = "high"
+                if confidence == "medium":
+                    confidence = "high"
             
             # Check if urgency persists
-            urgency_count = sum(
-                1 for d in conversation_history
-                if "urgency" in str(d.reasons).lower()
-            )
             if urgency_count >= 2 and current_signals.psychological.urgency_present:
-                current_decision.reasons.append(
-                    f"🔁 PERSISTENT URGENCY: {urgency_count + 1} turns"
-                )
+                reasons = (*reasons, Reason(R_PERSISTENT_URGENCY, (urgency_count + 1,)))
         
         # Final scam detection override: If any turn was HIGH or CRITICAL,
         # entire conversation is scam
-        if any(d.scam_detected for d in conversation_history):
-            current_decision.scam_detected = True
-        
-        return current_decision
+        return replace(
+            current_decision,
+            scam_detected=current_decision.scam_detected or any_scam,
+            risk_band=risk_band,
+            confidence=confidence,
+            reasons=reasons,
+            turn_count=turn_count,
+            risk_trajectory=risk_trajectory
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -594,13 +716,17 @@ def get_decision_explanation(decision: PolicyDecision) -> str:
     """
     Generate audit-friendly explanation of decision.
     Suitable for logging, review, or regulatory compliance.
+    Rendered once per decision and cached on it.
     """
+    if decision._explanation is not None:
+        return decision._explanation
+
     lines = []
     lines.append("=" * 70)
     lines.append(f"SCAM DETECTION DECISION — Turn {decision.turn_count}")
     lines.append("=" * 70)
     lines.append(f"Verdict: {'SCAM DETECTED' if decision.scam_detected else 'NOT A SCAM'}")
-    lines.append(f"Risk Band: {decision.risk_band.value}")
+    lines.append(f"Risk Band: {decision.risk_band.name}")
     lines.append(f"Confidence: {decision.confidence}")
     lines.append(f"Engagement: {decision.engagement_stance.value}")
     lines.append(f"Trajectory: {decision.risk_trajectory}")
@@ -616,13 +742,118 @@ def get_decision_explanation(decision: PolicyDecision) -> str:
             lines.append(f"  → {action}")
     
     lines.append("=" * 70)
-    return "\n".join(lines)
+    explanation = "\n".join(lines)
+    object.__setattr__(decision, "_explanation", explanation)
+    return explanation
 
 
 # ============================================================
 # LEGACY ENTRY POINT (for main.py)
 # ============================================================
 
+# ---- Adapter classes: legacy hard/soft dicts → signal groups ----
+# Defined once at module scope (not per call); slotted to keep each
+# per-request instance small.
+
+class _Irreversible:
+    __slots__ = ("requested_actions", "explicit_phrases", "_high_risk")
+
+    def __init__(self, hard):
+        # Already de-duplicated by the signal scan; no set() rebuild
+        self.requested_actions = hard.get("irreversible_actions") or ()
+        self.explicit_phrases = []
+        self._high_risk = bool(hard.get("high_risk", False))
+
+    def has_high_risk(self):
+        return self._high_risk
+
+    def has_any(self):
+        return bool(self.requested_actions)
+
+
+class _Psychological:
+    __slots__ = (
+        "urgency_present", "authority_claimed", "fear_tactics_present",
+        "reward_baiting", "verification_requested", "urgency_intensity",
+        "urgency_phrases", "authority_entities", "fear_phrases"
+    )
+
+    def __init__(self, hard):
+        self.urgency_present = hard.get("urgency", False)
+        self.authority_claimed = hard.get("authority", False)
+        self.fear_tactics_present = hard.get("fear", False)
+
+        self.reward_baiting = False
+        self.verification_requested = False
+
+        self.urgency_intensity = "high" if hard.get("urgency") else "none"
+        
+        # 🔥 BUG FIX #1: Added missing urgency_phrases attribute
+        # This prevents AttributeError when policy logic references len(psychological.urgency_phrases)
+        self.urgency_phrases = ["urgency"] if hard.get("urgency") else []
+        
+        self.authority_entities = []
+        self.fear_phrases = []
+
+
+class _Linguistic:
+    __slots__ = (
+        "language_mixing", "excessive_respect", "respect_marker_count",
+        "impersonation_language", "impersonation_phrases"
+    )
+
+    def __init__(self, soft):
+        self.language_mixing = soft.get("language_mixing", False)
+        self.excessive_respect = soft.get("excessive_respect", False)
+        self.respect_marker_count = 0
+
+        self.impersonation_language = False
+        self.impersonation_phrases = []
+
+
+class _Contextual:
+    __slots__ = (
+        "information_extraction_attempt", "combined_tactics",
+        "multiple_urgency_layers", "data_fields_requested"
+    )
+
+    def __init__(self, soft):
+        self.information_extraction_attempt = soft.get("information_extraction", False)
+        # Empty in most turns: share one empty tuple instead of a new list
+        self.combined_tactics = soft.get("combined_tactics") or ()
+        self.multiple_urgency_layers = len(self.combined_tactics) >= 2
+        self.data_fields_requested = []
+
+
+class _Signals:
+    __slots__ = ("irreversible", "psychological", "linguistic", "contextual", "validation")
+
+    def __init__(self, hard, soft, validation=None):
+        self.irreversible = _Irreversible(hard)
+        self.psychological = _Psychological(hard)
+        self.linguistic = _Linguistic(soft)
+        self.contextual = _Contextual(soft)
+        self.validation = validation
+
+
+_BENIGN_REASON_TEXT = str(_BENIGN_REASONS[0])
+
+
+def _gate_is_benign(hard: dict, soft: dict) -> bool:
+    """
+    True when the legacy dicts carry no indicator at all, i.e. when
+    _condition_bits() would return 0 for the adapted signals.
+    Reads each key once, straight off the dicts.
+    """
+    return not (
+        hard.get("high_risk") or hard.get("irreversible_actions") or
+        hard.get("authority") or hard.get("urgency") or hard.get("fear") or
+        soft.get("language_mixing") or soft.get("excessive_respect") or
+        soft.get("information_extraction") or
+        len(soft.get("combined_tactics") or ()) >= 2
+    )
+
+
 def policy_gate(hard: dict, soft: dict, validation: dict) -> dict:
     """
     Compatibility wrapper for main.py.
@@ -631,74 +862,27 @@ def policy_gate(hard: dict, soft: dict, validation: dict) -> dict:
     🔥 FIXED: Added urgency_phrases to prevent AttributeError
     🔥 FIXED: Now returns validation data for audit trail
     """
+    if _gate_is_benign(hard, soft):
+        # Common case: skip the adapters and the decision object entirely
+        return {
+            "scam": False,
+            "risk": "BENIGN",
+            "confidence": "high",
+            "risk_band": "BENIGN",
+            "reasons": [_BENIGN_REASON_TEXT],
+            "validation": validation
+        }
 
-    # ---- Proper adapter classes (NO lambdas) ----
-
-    class _Irreversible:
-        def __init__(self, hard):
-            self.requested_actions = set(hard.get("irreversible_actions", []))
-            self.explicit_phrases = []
-
-        def has_high_risk(self):
-            return bool(hard.get("high_risk", False))
-
-        def has_any(self):
-            return bool(self.requested_actions)
-
-    class _Psychological:
-        def __init__(self, hard):
-            self.urgency_present = hard.get("urgency", False)
-            self.authority_claimed = hard.get("authority", False)
-            self.fear_tactics_present = hard.get("fear", False)
-
-            self.reward_baiting = False
-            self.verification_requested = False
-
-            self.urgency_intensity = "high" if hard.get("urgency") else "none"
-            
-            # 🔥 BUG FIX #1: Added missing urgency_phrases attribute
-            # This prevents AttributeError when policy logic references len(psychological.urgency_phrases)
-            self.urgency_phrases = ["urgency"] if hard.get("urgency") else []
-            
-            self.authority_entities = []
-            self.fear_phrases = []
-
-    class _Linguistic:
-        def __init__(self, soft):
-            self.language_mixing = soft.get("language_mixing", False)
-            self.excessive_respect = soft.get("excessive_respect", False)
-            self.respect_marker_count = 0
-
-            self.impersonation_language = False
-            self.impersonation_phrases = []
-
-    class _Contextual:
-        def __init__(self, soft):
-            self.information_extraction_attempt = soft.get("information_extraction", False)
-            self.combined_tactics = soft.get("combined_tactics", [])
-            self.multiple_urgency_layers = len(self.combined_tactics) >= 2
-            self.data_fields_requested = []
-
-    class _Signals:
-        def __init__(self, hard, soft):
-            self.irreversible = _Irreversible(hard)
-            self.psychological = _Psychological(hard)
-            self.linguistic = _Linguistic(soft)
-            self.contextual = _Contextual(soft)
-
-    # ---- Build signals & evaluate ----
-
-    signals = _Signals(hard, soft)
-    signals.validation = validation  # 🔥 ADD THIS LINE
+    signals = _Signals(hard, soft, validation)
     decision = evaluate_message(signals)
 
     # 🔥 BUG FIX #2: Return validation data for audit trail
     # Previously validation was passed as argument but never used/returned
     return {
         "scam": decision.scam_detected,
-        "risk": decision.risk_band.value,
+        "risk": decision.risk_band.name,
         "confidence": decision.confidence,
-        "risk_band": decision.risk_band.value,
-        "reasons": decision.reasons,
+        "risk_band": decision.risk_band.name,
+        "reasons": [str(r) for r in decision.reasons],
         "validation": validation  # Now returned for downstream logging/auditing
-    }
\ No newline at end of file
+    }
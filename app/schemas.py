@@ -2,7 +2,8 @@ from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any, Union
 
 class HoneypotRequest(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    # Requests are read-only once parsed
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     conversation_id: Optional[str] = Field(default="default")
     turn: Optional[Union[int, str]] = Field(default=1)
@@ -18,8 +18,9 @@ Signals are grouped by analyst reasoning categories:
 """
 
 import re
-from typing import List, Dict, Set
-from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from typing import List, Dict, Pattern, Set, Tuple
+from dataclasses import dataclass, field
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -68,6 +69,35 @@ IRREVERSIBLE_ACTIONS: Dict[str, List[str]] = {
 }
 
 
+# Categories whose actions count as high risk
+_HIGH_RISK_ACTIONS = frozenset({
+    "credential_sharing",
+    "remote_access_installation",
+    "immediate_payment",
+    "account_access_sharing"
+})
+
+# phrase -> (table position, category)
+_IRREVERSIBLE_INDEX: Dict[str, Tuple[int, str]] = {
+    phrase: (position, category)
+    for position, (category, phrase) in enumerate(
+        (category, phrase)
+        for category, phrases in IRREVERSIBLE_ACTIONS.items()
+        for phrase in phrases
+    )
+}
+
+# Every phrase in one word-bounded alternation, scanned in a single pass.
+# The zero-width lookahead lets overlapping phrases ("atm pin" / "pin")
+# each report a match. Relies on no phrase being a word-bounded prefix of
+# another, so at most one phrase can match at any start position.
+_IRREVERSIBLE_RE: Pattern = re.compile(
+    r"(?=\b("
+    + "|".join(re.escape(p) for p in sorted(_IRREVERSIBLE_INDEX, key=len, reverse=True))
+    + r")\b)"
+)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # PSYCHOLOGICAL TACTICS
 # ═══════════════════════════════════════════════════════════════════════════
@@ -105,10 +135,11 @@ VERIFICATION_REQUESTS = [
 # LINGUISTIC PATTERNS
 # ═══════════════════════════════════════════════════════════════════════════
 
-HINDI_ROMANIZED_WORDS = [
+# Only used for per-token membership, so a set rather than a list
+HINDI_ROMANIZED_WORDS = frozenset({
     "hai", "hain", "aap", "aapka", "aapko",
     "karo", "kijiye", "sir", "madam", "ji"
-]
+})
 
 FORMAL_HINDI_PHRASES = [
     "namaste", "namaskar", "kripya"
@@ -135,7 +166,7 @@ INFORMATION_EXTRACTION = [
 # STRUCTURED OUTPUT
 # ═══════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class IrreversibleActionSignals:
     requested_actions: Set[str] = field(default_factory=set)
     explicit_phrases: List[str] = field(default_factory=list)
@@ -144,15 +175,16 @@ class IrreversibleActionSignals:
         return bool(self.requested_actions)
 
     def has_high_risk(self) -> bool:
-        return bool(self.requested_actions & {
-            "credential_sharing",
-            "remote_access_installation",
-            "immediate_payment",
-            "account_access_sharing"
-        })
+        return not self.requested_actions.isdisjoint(_HIGH_RISK_ACTIONS)
 
+    def to_dict(self) -> dict:
+        return {
+            "requested_actions": set(self.requested_actions),
+            "explicit_phrases": list(self.explicit_phrases)
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class PsychologicalTacticSignals:
     urgency_present: bool = False
     urgency_phrases: List[str] = field(default_factory=list)
@@ -170,8 +202,23 @@ class PsychologicalTacticSignals:
     verification_requested: bool = False
     verification_phrases: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict:
+        return {
+            "urgency_present": self.urgency_present,
+            "urgency_phrases": list(self.urgency_phrases),
+            "urgency_intensity": self.urgency_intensity,
+            "authority_claimed": self.authority_claimed,
+            "authority_entities": list(self.authority_entities),
+            "fear_tactics_present": self.fear_tactics_present,
+            "fear_phrases": list(self.fear_phrases),
+            "reward_baiting": self.reward_baiting,
+            "reward_phrases": list(self.reward_phrases),
+            "verification_requested": self.verification_requested,
+            "verification_phrases": list(self.verification_phrases)
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class LinguisticSignals:
     language_mixing: bool = False
     hindi_word_count: int = 0
@@ -185,8 +232,20 @@ class LinguisticSignals:
     impersonation_language: bool = False
     impersonation_phrases: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> dict:
+        return {
+            "language_mixing": self.language_mixing,
+            "hindi_word_count": self.hindi_word_count,
+            "english_word_count": self.english_word_count,
+            "excessive_respect": self.excessive_respect,
+            "respect_marker_count": self.respect_marker_count,
+            "formal_hindi_present": self.formal_hindi_present,
+            "impersonation_language": self.impersonation_language,
+            "impersonation_phrases": list(self.impersonation_phrases)
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class ContextualSignals:
     information_extraction_attempt: bool = False
     data_fields_requested: List[str] = field(default_factory=list)
@@ -197,8 +256,17 @@ class ContextualSignals:
     # NEW — escalation indicator (OBSERVATIONAL)
     escalation_detected: bool = False
 
+    def to_dict(self) -> dict:
+        return {
+            "information_extraction_attempt": self.information_extraction_attempt,
+            "data_fields_requested": list(self.data_fields_requested),
+            "multiple_urgency_layers": self.multiple_urgency_layers,
+            "combined_tactics": list(self.combined_tactics),
+            "escalation_detected": self.escalation_detected
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedSignals:
     irreversible: IrreversibleActionSignals = field(default_factory=IrreversibleActionSignals)
     psychological: PsychologicalTacticSignals = field(default_factory=PsychologicalTacticSignals)
@@ -207,10 +275,10 @@ class ExtractedSignals:
 
     def to_dict(self) -> dict:
         return {
-            "irreversible": asdict(self.irreversible),
-            "psychological": asdict(self.psychological),
-            "linguistic": asdict(self.linguistic),
-            "contextual": asdict(self.contextual)
+            "irreversible": self.irreversible.to_dict(),
+            "psychological": self.psychological.to_dict(),
+            "linguistic": self.linguistic.to_dict(),
+            "contextual": self.contextual.to_dict()
         }
 
 
@@ -218,21 +286,23 @@ class ExtractedSignals:
 # EXTRACTION FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════
 
-def extract_irreversible_actions(text: str) -> IrreversibleActionSignals:
-    text_lower = text.lower()
+# The extractors below take already-lowercased text: extract_signals
+# lowercases once and hands the same string to each of them
+
+def extract_irreversible_actions(text_lower: str) -> IrreversibleActionSignals:
     signals = IrreversibleActionSignals()
 
-    for category, phrases in IRREVERSIBLE_ACTIONS.items():
-        for phrase in phrases:
-            if re.search(rf"\b{re.escape(phrase)}\b", text_lower):
-                signals.requested_actions.add(category)
-                signals.explicit_phrases.append(phrase)
+    found = {m.group(1) for m in _IRREVERSIBLE_RE.finditer(text_lower)}
+    if found:
+        # Report phrases in table order, as the per-phrase scan did
+        for phrase in sorted(found, key=_IRREVERSIBLE_INDEX.__getitem__):
+            signals.requested_actions.add(_IRREVERSIBLE_INDEX[phrase][1])
+            signals.explicit_phrases.append(phrase)
 
     return signals
 
 
-def extract_psychological_tactics(text: str) -> PsychologicalTacticSignals:
-    text_lower = text.lower()
+def extract_psychological_tactics(text_lower: str) -> PsychologicalTacticSignals:
     signals = PsychologicalTacticSignals()
 
     urgency_matches = [w for w in URGENCY_INDICATORS if w in text_lower]
@@ -268,17 +338,20 @@ def extract_psychological_tactics(text: str) -> PsychologicalTacticSignals:
     return signals
 
 
-def extract_linguistic_signals(text: str) -> LinguisticSignals:
-    text_lower = text.lower()
-    words = text_lower.split()
+def extract_linguistic_signals(text_lower: str) -> LinguisticSignals:
     signals = LinguisticSignals()
 
-    signals.hindi_word_count = sum(1 for w in words if w in HINDI_ROMANIZED_WORDS)
-    signals.english_word_count = sum(
-        1 for w in words if w.isascii() and w.isalpha() and w not in HINDI_ROMANIZED_WORDS
-    )
+    # One pass over the tokens for both counts
+    hindi_count = english_count = 0
+    for w in text_lower.split():
+        if w in HINDI_ROMANIZED_WORDS:
+            hindi_count += 1
+        elif w.isascii() and w.isalpha():
+            english_count += 1
+    signals.hindi_word_count = hindi_count
+    signals.english_word_count = english_count
 
-    signals.language_mixing = signals.hindi_word_count > 0 and signals.english_word_count > 0
+    signals.language_mixing = hindi_count > 0 and english_count > 0
 
     respect_markers = [w for w in EXCESSIVE_RESPECT_MARKERS if w in text_lower]
     signals.respect_marker_count = len(respect_markers)
@@ -295,11 +368,10 @@ def extract_linguistic_signals(text: str) -> LinguisticSignals:
 
 
 def extract_contextual_signals(
-    text: str,
+    text_lower: str,
     psychological: PsychologicalTacticSignals
 ) -> ContextualSignals:
 
-    text_lower = text.lower()
     signals = ContextualSignals()
 
     info_matches = [p for p in INFORMATION_EXTRACTION if p in text_lower]
@@ -307,24 +379,28 @@ def extract_contextual_signals(
         signals.information_extraction_attempt = True
         signals.data_fields_requested = info_matches
 
-    tactics = []
-    if psychological.urgency_present:
-        tactics.append("urgency")
-    if psychological.authority_claimed:
-        tactics.append("authority")
-    if psychological.fear_tactics_present:
-        tactics.append("fear")
-    if psychological.reward_baiting:
-        tactics.append("reward")
-
-    if len(tactics) >= 2:
+    urgency = psychological.urgency_present
+    authority = psychological.authority_claimed
+    fear = psychological.fear_tactics_present
+    reward = psychological.reward_baiting
+
+    # Count first; most messages carry at most one tactic and never
+    # need the list
+    if urgency + authority + fear + reward >= 2:
+        tactics = []
+        if urgency:
+            tactics.append("urgency")
+        if authority:
+            tactics.append("authority")
+        if fear:
+            tactics.append("fear")
+        if reward:
+            tactics.append("reward")
         signals.multiple_urgency_layers = True
         signals.combined_tactics = tactics
         signals.escalation_detected = True
 
-    if psychological.verification_requested and (
-        psychological.urgency_present or psychological.authority_claimed
-    ):
+    if psychological.verification_requested and (urgency or authority):
         signals.escalation_detected = True
 
     return signals
@@ -335,14 +411,27 @@ def extract_contextual_signals(
 # ═══════════════════════════════════════════════════════════════════════════
 
 def extract_signals(text: str) -> ExtractedSignals:
-    signals = ExtractedSignals()
+    # Empty / whitespace-only input cannot match anything: all defaults
+    if not text or text.isspace():
+        return ExtractedSignals()
+
+    text_lower = text.lower()
+    psychological = extract_psychological_tactics(text_lower)
+
+    return ExtractedSignals(
+        irreversible=extract_irreversible_actions(text_lower),
+        psychological=psychological,
+        linguistic=extract_linguistic_signals(text_lower),
+        contextual=extract_contextual_signals(text_lower, psychological)
+    )
 
-    signals.irreversible = extract_irreversible_actions(text)
-    signals.psychological = extract_psychological_tactics(text)
-    signals.linguistic = extract_linguistic_signals(text)
-    signals.contextual = extract_contextual_signals(text, signals.psychological)
 
-    return signals
+@lru_cache(maxsize=4096)
+def _cached_signals(text: str) -> ExtractedSignals:
+    # hard_signal_scan and soft_signal_placeholder run on the same message
+    # for every request; extract once and share. The instance is shared
+    # across callers, so only copies of its containers may leave this module.
+    return extract_signals(text)
 
 # ============================================================
 # BACKWARD-COMPATIBILITY LAYER (for main.py)
@@ -353,7 +442,7 @@ def hard_signal_scan(text: str) -> dict:
     Legacy-compatible hard signal scan.
     Maps to irreversible + psychological signals.
     """
-    signals = extract_signals(text)
+    signals = _cached_signals(text)
     return {
         "irreversible_actions": list(signals.irreversible.requested_actions),
         "high_risk": signals.irreversible.has_high_risk(),
@@ -368,10 +457,10 @@ def soft_signal_placeholder(text: str) -> dict:
     Legacy-compatible soft signals.
     Maps to linguistic + contextual hints.
     """
-    signals = extract_signals(text)
+    signals = _cached_signals(text)
     return {
         "language_mixing": signals.linguistic.language_mixing,
         "excessive_respect": signals.linguistic.excessive_respect,
         "information_extraction": signals.contextual.information_extraction_attempt,
-        "combined_tactics": signals.contextual.combined_tactics,
+        "combined_tactics": list(signals.contextual.combined_tactics),
     }
@@ -1,6 +1,9 @@
 import re
 import os
 import json
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import Dict, Optional
 from groq import Groq
 
@@ -8,24 +11,51 @@ from groq import Groq
 # Authority Claim Extraction (STRICT + Conservative)
 # ============================================================
 
+# One alternation, one pass. Groups are numbered in priority order:
+# when several match, the lowest group number wins, not the leftmost
+_AUTHORITY_RE = re.compile(
+    r"\b(?:"
+    r"(hdfc|icici|sbi|axis|kotak)\s+bank"
+    r"|(fedex|blue\s?dart|dhl)"
+    r"|(police|cyber\s?crime|ncb)"
+    r"|(rbi|income\s?tax|customs)"
+    r")\b"
+)
+
+# Every alternative above contains one of these literals, so a message
+# without any of them cannot match and skips the regex entirely
+_AUTHORITY_LITERALS = (
+    "hdfc", "icici", "sbi", "axis", "kotak",
+    "fedex", "dart", "dhl",
+    "police", "crime", "ncb",
+    "rbi", "tax", "customs",
+)
+
+
 def extract_authority_claim(message: str) -> Optional[str]:
     """
     Extract claimed authority entity (VERY conservative).
     Returns normalized entity name or None.
     """
-    patterns = [
-        r"\b(hdfc|icici|sbi|axis|kotak)\s+bank\b",
-        r"\b(fedex|blue\s?dart|dhl)\b",
-        r"\b(police|cyber\s?crime|ncb)\b",
-        r"\b(rbi|income\s?tax|customs)\b",
-    ]
+    if not message:
+        return None
 
     msg = message.lower()
-    for p in patterns:
-        match = re.search(p, msg)
-        if match:
-            return match.group(1).replace(" ", "")
-    return None
+    for literal in _AUTHORITY_LITERALS:
+        if literal in msg:
+            break
+    else:
+        return None
+
+    best = None
+    for match in _AUTHORITY_RE.finditer(msg):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+    if best is None:
+        return None
+    return best.group(best.lastindex).replace(" ", "")
 
 
 # ============================================================
@@ -50,16 +80,58 @@ KNOWN_AUTHORITIES = {
 # LLM-Assisted Impersonation Analysis (SAFE MODE)
 # ============================================================
 
+_groq_client: Optional[Groq] = None
+
+
+def _get_groq_client() -> Optional[Groq]:
+    """Build the Groq client once and reuse its connection pool"""
+    global _groq_client
+
+    if _groq_client is None:
+        api_key = os.getenv("GROQ_API_KEY")
+        if api_key:
+            # A race between worker threads at most builds a spare client
+            _groq_client = Groq(api_key=api_key)
+    return _groq_client
+
+
+# Verdicts by message digest. Scam scripts are replayed verbatim across
+# sessions and retries, and each miss is a Groq round trip
+IMPERSONATION_CACHE_SIZE = 1024
+
+_IMPERSONATION_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+# Validation runs in worker threads (asyncio.to_thread)
+_IMPERSONATION_LOCK = threading.Lock()
+
+
 def _analyze_impersonation_llm(message: str) -> Optional[str]:
     """
     Uses Groq ONLY to judge linguistic impersonation likelihood.
     Returns: "low" | "medium" | "high" | None
     """
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
-        return None
+    key = blake2b(message.encode(), digest_size=16).digest()
+    with _IMPERSONATION_LOCK:
+        level = _IMPERSONATION_CACHE.get(key)
+        if level is not None:
+            _IMPERSONATION_CACHE.move_to_end(key)
+            return level
+
+    level = _query_impersonation_llm(message)
+
+    # None means no key / API failure: retry next time rather than cache it
+    if level is not None:
+        with _IMPERSONATION_LOCK:
+            _IMPERSONATION_CACHE[key] = level
+            _IMPERSONATION_CACHE.move_to_end(key)
+            if len(_IMPERSONATION_CACHE) > IMPERSONATION_CACHE_SIZE:
+                _IMPERSONATION_CACHE.popitem(last=False)
+    return level
 
-    client = Groq(api_key=api_key)
+
+def _query_impersonation_llm(message: str) -> Optional[str]:
+    client = _get_groq_client()
+    if client is None:
+        return None
 
     system_prompt = (
         "You are a security analysis engine.\n"
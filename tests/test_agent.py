@@ -0,0 +1,148 @@
+"""Agent reply tests: canned trivial-turn replies and Groq call coalescing."""
+
+import asyncio
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from app import agent, memory
+from app.agent import DIRECT_REPLIES, direct_reply
+from app.main import _direct_reply
+from app.memory import MAX_HISTORY, Turn
+from app.schemas import HoneypotRequest
+
+
+def _forget(conversation_id):
+    for store in (memory.CONVERSATIONS, memory.AGENT_COUNTS, memory.LAST_SEEN, memory.VERSIONS):
+        store.pop(conversation_id, None)
+
+
+def test_direct_reply_rotates_on_agent_count():
+    history = deque([Turn("scammer", "hello")], maxlen=MAX_HISTORY)
+    replies = DIRECT_REPLIES["english"]
+
+    seen = [direct_reply(history, count) for count in range(2 * len(replies))]
+
+    assert seen == replies * 2
+
+
+def test_direct_reply_uses_conversation_language():
+    hinglish = [Turn("scammer", "Namaste ji, main bank se bol raha hoon")]
+    hindi = [Turn("scammer", "आपका अकाउंट ब्लॉक हो गया है")]
+
+    assert direct_reply(hinglish, 0) == DIRECT_REPLIES["hinglish"][0]
+    assert direct_reply(hindi, 1) == DIRECT_REPLIES["hindi"][1]
+
+
+def test_direct_reply_keeps_rotating_once_history_is_full():
+    conversation_id = "test-direct-reply-rotation"
+    req = HoneypotRequest.model_construct(
+        conversation_id=conversation_id, turn=1, message="ok", execution_mode="live"
+    )
+    replies = DIRECT_REPLIES["english"]
+    seen = []
+    try:
+        for _ in range(2 * MAX_HISTORY):
+            history = memory.append_message(conversation_id, "scammer", "ok")
+            seen.append(_direct_reply(req, history))
+    finally:
+        _forget(conversation_id)
+
+    # The bounded history stops growing after MAX_HISTORY turns; the
+    # rotation must not stall there
+    assert seen == [replies[i % len(replies)] for i in range(2 * MAX_HISTORY)]
+
+
+def test_direct_reply_skipped_outside_live_mode():
+    req = HoneypotRequest.model_construct(
+        conversation_id="test-direct-reply-shadow", turn=1, message="ok",
+        execution_mode="shadow"
+    )
+    assert _direct_reply(req, [Turn("scammer", "ok")]) is None
+
+
+class _StubStream:
+    def __init__(self, pieces):
+        self._pieces = iter(pieces)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            piece = next(self._pieces)
+        except StopIteration:
+            raise StopAsyncIteration
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    async def close(self):
+        pass
+
+
+class _StubGroq:
+    """Stands in for AsyncGroq: counts create() calls, streams a fixed reply."""
+
+    def __init__(self, pieces=None, error=None):
+        self.calls = []
+        self._pieces = pieces or ["Which branch ", "is this?"]
+        self._error = error
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        # Yield so concurrent callers arrive while this call is in flight
+        await asyncio.sleep(0.01)
+        if self._error is not None:
+            raise self._error
+        return _StubStream(self._pieces)
+
+
+@pytest.fixture
+def groq_stub(monkeypatch):
+    def install(**kwargs):
+        client = _StubGroq(**kwargs)
+        monkeypatch.setattr(agent, "_get_groq_client", lambda: client)
+        return client
+
+    agent._REPLY_CACHE.clear()
+    agent._IN_FLIGHT.clear()
+    yield install
+    agent._REPLY_CACHE.clear()
+    agent._IN_FLIGHT.clear()
+
+
+def test_concurrent_callers_share_one_groq_call(groq_stub):
+    client = groq_stub()
+    snapshot = [Turn("scammer", "Share your OTP now")]
+    key = agent._reply_cache_key(snapshot, "english", "otp_request")
+
+    async def run():
+        return await asyncio.gather(*(
+            agent._coalesced_groq_reply(key, snapshot, "english") for _ in range(5)
+        ))
+
+    replies = asyncio.run(run())
+
+    assert len(client.calls) == 1
+    assert replies == ["Which branch is this?"] * 5
+    assert agent._get_cached_reply(key) == "Which branch is this?"
+    assert not agent._IN_FLIGHT
+
+
+def test_failed_groq_call_is_shared_but_not_cached(groq_stub):
+    client = groq_stub(error=RuntimeError("boom"))
+    snapshot = [Turn("scammer", "Share your OTP now")]
+    key = agent._reply_cache_key(snapshot, "english", "otp_request")
+
+    async def run():
+        return await asyncio.gather(*(
+            agent._coalesced_groq_reply(key, snapshot, "english") for _ in range(3)
+        ))
+
+    replies = asyncio.run(run())
+
+    assert len(client.calls) == 1
+    assert len(set(replies)) == 1
+    assert agent._get_cached_reply(key) is None
+    assert not agent._IN_FLIGHT
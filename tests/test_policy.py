@@ -0,0 +1,205 @@
+"""
+Policy regression tests.
+
+evaluate_single_turn() is table-driven; these tests pin it to the
+original first-match-wins rule chain, and pin the cross-turn risk floor
+to the RiskBand severity order.
+"""
+
+import itertools
+from types import SimpleNamespace
+
+from app.policy import (
+    EngagementStance,
+    RiskBand,
+    ScamDetectionPolicy,
+    evaluate_message,
+)
+
+HIGH_RISK_ACTIONS = {
+    "credential_sharing", "remote_access_installation",
+    "immediate_payment", "account_access_sharing",
+}
+
+
+def make_signals(
+    actions=(),
+    urgency="none",
+    authority=False,
+    fear=False,
+    reward=False,
+    verification=False,
+    language_mixing=False,
+    excessive_respect=False,
+    impersonation=False,
+    info_extraction=False,
+    urgency_layers=False,
+):
+    actions = set(actions)
+    irreversible = SimpleNamespace(
+        requested_actions=actions,
+        explicit_phrases=sorted(actions),
+        has_high_risk=lambda: bool(actions & HIGH_RISK_ACTIONS),
+        has_any=lambda: bool(actions),
+    )
+    psychological = SimpleNamespace(
+        urgency_present=urgency != "none",
+        urgency_intensity=urgency,
+        urgency_phrases=["urgent"] if urgency != "none" else [],
+        authority_claimed=authority,
+        authority_entities=["bank"] if authority else [],
+        fear_tactics_present=fear,
+        fear_phrases=["blocked"] if fear else [],
+        reward_baiting=reward,
+        verification_requested=verification,
+    )
+    linguistic = SimpleNamespace(
+        language_mixing=language_mixing,
+        excessive_respect=excessive_respect,
+        respect_marker_count=2 if excessive_respect else 0,
+        impersonation_language=impersonation,
+        impersonation_phrases=["calling from"] if impersonation else [],
+    )
+    contextual = SimpleNamespace(
+        information_extraction_attempt=info_extraction,
+        data_fields_requested=["otp"] if info_extraction else [],
+        multiple_urgency_layers=urgency_layers,
+        combined_tactics=["urgency", "fear"] if urgency_layers else [],
+    )
+    return SimpleNamespace(
+        irreversible=irreversible,
+        psychological=psychological,
+        linguistic=linguistic,
+        contextual=contextual,
+    )
+
+
+def reference_verdict(s):
+    """The pre-table if-chain: (scam, band, confidence, stance)."""
+    ir, ps, li, co = s.irreversible, s.psychological, s.linguistic, s.contextual
+    honeypot = EngagementStance.ENGAGE_HONEYPOT
+    defensive = EngagementStance.ENGAGE_DEFENSIVE
+    allow = EngagementStance.ALLOW
+
+    if ir.has_high_risk():
+        return True, RiskBand.CRITICAL, "definitive", honeypot
+    if ir.has_any():
+        return True, RiskBand.HIGH, "high", honeypot
+    if (not ps.fear_tactics_present and ps.verification_requested
+            and not ps.urgency_present):
+        return False, RiskBand.LOW, "medium", allow
+    if ps.authority_claimed and ps.urgency_present and li.language_mixing:
+        return True, RiskBand.HIGH, "high", honeypot
+    if co.multiple_urgency_layers:
+        if ps.authority_claimed:
+            return True, RiskBand.HIGH, "high", honeypot
+        return True, RiskBand.MEDIUM, "medium", defensive
+    if ps.authority_claimed and ps.fear_tactics_present:
+        return True, RiskBand.HIGH, "high", honeypot
+    if co.information_extraction_attempt and li.impersonation_language:
+        return True, RiskBand.HIGH, "medium", defensive
+    if ps.authority_claimed:
+        legitimate = not (
+            ps.fear_tactics_present
+            or (ps.urgency_present and (ps.fear_tactics_present or ps.reward_baiting))
+            or li.excessive_respect
+        )
+        if not legitimate:
+            return True, RiskBand.MEDIUM, "medium", defensive
+    if ps.urgency_present and ps.urgency_intensity in ("high", "medium"):
+        return False, RiskBand.MEDIUM, "low", defensive
+    if co.information_extraction_attempt:
+        return False, RiskBand.MEDIUM, "low", defensive
+    if (ps.urgency_present or ps.reward_baiting
+            or li.language_mixing or li.excessive_respect):
+        return False, RiskBand.LOW, "low", allow
+    return False, RiskBand.BENIGN, "high", allow
+
+
+def verdict(decision):
+    return (
+        decision.scam_detected,
+        decision.risk_band,
+        decision.confidence,
+        decision.engagement_stance,
+    )
+
+
+FLAGS = (
+    "authority", "fear", "reward", "verification", "language_mixing",
+    "excessive_respect", "impersonation", "info_extraction", "urgency_layers",
+)
+
+
+def test_single_turn_matches_reference_rule_chain():
+    action_sets = ((), ("link_interaction",), ("credential_sharing",))
+    urgencies = ("none", "low", "medium", "high")
+    checked = 0
+    for actions, urgency in itertools.product(action_sets, urgencies):
+        for bits in itertools.product((False, True), repeat=len(FLAGS)):
+            signals = make_signals(actions, urgency, **dict(zip(FLAGS, bits)))
+            decision = ScamDetectionPolicy.evaluate_single_turn(signals)
+            expected = reference_verdict(signals)
+            assert verdict(decision) == expected, (actions, urgency, bits)
+            assert decision.engage == (expected[3] != EngagementStance.BLOCK)
+            checked += 1
+    assert checked == 3 * 4 * 2 ** len(FLAGS)
+
+
+def test_single_turn_representative_cases():
+    cases = [
+        (make_signals(), (False, RiskBand.BENIGN, "high", EngagementStance.ALLOW)),
+        (make_signals(actions=("credential_sharing",), verification=True),
+         (True, RiskBand.CRITICAL, "definitive", EngagementStance.ENGAGE_HONEYPOT)),
+        (make_signals(verification=True, authority=True),
+         (False, RiskBand.LOW, "medium", EngagementStance.ALLOW)),
+        (make_signals(authority=True, urgency="low", language_mixing=True),
+         (True, RiskBand.HIGH, "high", EngagementStance.ENGAGE_HONEYPOT)),
+        (make_signals(urgency_layers=True),
+         (True, RiskBand.MEDIUM, "medium", EngagementStance.ENGAGE_DEFENSIVE)),
+        (make_signals(authority=True, excessive_respect=True),
+         (True, RiskBand.MEDIUM, "medium", EngagementStance.ENGAGE_DEFENSIVE)),
+        (make_signals(authority=True),
+         (False, RiskBand.BENIGN, "high", EngagementStance.ALLOW)),
+        (make_signals(urgency="low"),
+         (False, RiskBand.LOW, "low", EngagementStance.ALLOW)),
+    ]
+    for signals, expected in cases:
+        assert verdict(ScamDetectionPolicy.evaluate_single_turn(signals)) == expected
+
+
+def test_risk_bands_order_by_severity():
+    assert (RiskBand.BENIGN < RiskBand.LOW < RiskBand.MEDIUM
+            < RiskBand.HIGH < RiskBand.CRITICAL)
+
+
+def test_risk_never_drops_below_highest_previous_turn():
+    critical = evaluate_message(make_signals(actions=("credential_sharing",)))
+    low = evaluate_message(make_signals(urgency="low"), [critical])
+    benign = evaluate_message(make_signals(), [critical, low])
+
+    assert low.risk_band == RiskBand.CRITICAL
+    assert benign.risk_band == RiskBand.CRITICAL
+    assert benign.scam_detected
+    assert benign.risk_trajectory == "stable"
+    assert benign.turn_count == 3
+
+
+def test_floor_uses_highest_band_not_latest():
+    medium = evaluate_message(make_signals(info_extraction=True))
+    high = evaluate_message(make_signals(authority=True, fear=True), [medium])
+    low = evaluate_message(make_signals(urgency="low"), [medium, high])
+
+    assert medium.risk_band == RiskBand.MEDIUM
+    assert high.risk_band == RiskBand.HIGH
+    assert high.risk_trajectory == "escalating"
+    assert low.risk_band == RiskBand.HIGH
+
+
+def test_escalation_from_benign_to_critical():
+    benign = evaluate_message(make_signals())
+    critical = evaluate_message(make_signals(actions=("immediate_payment",)), [benign])
+
+    assert critical.risk_band == RiskBand.CRITICAL
+    assert critical.risk_trajectory == "escalating"
+    assert critical.turn_count == 2
@@ -0,0 +1,105 @@
+"""Authority claim extraction and impersonation verdict cache tests."""
+
+import itertools
+import re
+
+import pytest
+
+from app import validator
+from app.validator import extract_authority_claim
+
+# The original one-pattern-per-tier scan, searched in priority order
+_REFERENCE_PATTERNS = [
+    r"\b(hdfc|icici|sbi|axis|kotak)\s+bank\b",
+    r"\b(fedex|blue\s?dart|dhl)\b",
+    r"\b(police|cyber\s?crime|ncb)\b",
+    r"\b(rbi|income\s?tax|customs)\b",
+]
+
+
+def reference_authority_claim(message):
+    msg = message.lower()
+    for pattern in _REFERENCE_PATTERNS:
+        match = re.search(pattern, msg)
+        if match:
+            return match.group(1).replace(" ", "")
+    return None
+
+
+FRAGMENTS = [
+    "HDFC Bank", "sbi  bank", "axis", "kotak bank", "sbibank",
+    "FedEx", "blue dart", "bluedart", "blue\tdart", "dhl",
+    "Police", "cyber crime", "cybercrime", "ncb",
+    "RBI", "income tax", "customs", "rbis", "taxi", "your account",
+]
+
+
+def test_lowest_group_wins_over_leftmost_match():
+    assert extract_authority_claim("Police here about your HDFC bank account") == "hdfc"
+    assert extract_authority_claim("RBI notice: your FedEx parcel is held") == "fedex"
+    assert extract_authority_claim("customs flagged it, call cyber crime cell") == "cybercrime"
+    assert extract_authority_claim("ncb and dhl and sbi bank") == "sbi"
+
+
+def test_matches_reference_on_fragment_pairs():
+    messages = [*FRAGMENTS, *(
+        f"{a} and {b}" for a, b in itertools.permutations(FRAGMENTS, 2)
+    )]
+    for message in messages:
+        assert extract_authority_claim(message) == reference_authority_claim(message), message
+
+
+def test_messages_without_authority_literals():
+    assert extract_authority_claim("") is None
+    assert extract_authority_claim("Hello sir, please share the code") is None
+    # A literal alone is not a claim: the regex still decides
+    assert extract_authority_claim("book a taxi for sbibank") is None
+
+
+@pytest.fixture
+def impersonation_queries(monkeypatch):
+    """Replace the Groq query with a scripted one; returns the call log."""
+    calls = []
+
+    def install(verdict):
+        def query(message):
+            calls.append(message)
+            return verdict
+        monkeypatch.setattr(validator, "_query_impersonation_llm", query)
+        return calls
+
+    validator._IMPERSONATION_CACHE.clear()
+    yield install
+    validator._IMPERSONATION_CACHE.clear()
+
+
+def test_impersonation_verdict_is_cached(impersonation_queries):
+    calls = impersonation_queries("high")
+
+    assert validator._analyze_impersonation_llm("I am calling from RBI") == "high"
+    assert validator._analyze_impersonation_llm("I am calling from RBI") == "high"
+    assert validator._analyze_impersonation_llm("I am calling from SBI") == "high"
+
+    assert calls == ["I am calling from RBI", "I am calling from SBI"]
+
+
+def test_missing_impersonation_verdict_is_retried(impersonation_queries):
+    calls = impersonation_queries(None)
+
+    assert validator._analyze_impersonation_llm("I am calling from RBI") is None
+    assert validator._analyze_impersonation_llm("I am calling from RBI") is None
+
+    assert len(calls) == 2
+    assert not validator._IMPERSONATION_CACHE
+
+
+def test_impersonation_cache_is_bounded(impersonation_queries, monkeypatch):
+    monkeypatch.setattr(validator, "IMPERSONATION_CACHE_SIZE", 2)
+    calls = impersonation_queries("low")
+
+    for message in ("a", "b", "a", "c", "a", "b"):
+        validator._analyze_impersonation_llm(message)
+
+    # "a" stays fresh on every hit, so "b" is the one evicted by "c"
+    assert calls == ["a", "b", "c", "b"]
+    assert len(validator._IMPERSONATION_CACHE) == 2